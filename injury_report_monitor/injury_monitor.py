@@ -5,19 +5,83 @@ Aggregates injury data from multiple public sources, cross-references with
 today's game schedule, tracks status changes, and produces structured reports.
 """
 
+import io
 import json
 import logging
 import os
-from datetime import datetime, timezone
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
 from .injury_sources import fetch_all_injuries
-from .shipp_wrapper import ShippClient
+from .shipp_wrapper import SUPPORTED_SPORTS, ShippClient
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib codec
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_STATE_PATH = os.path.expanduser("~/.injury_monitor_state.json")
+STATE_RETENTION_DAYS = 30  # drop state entries not seen for this long
+OTHER_INJURIES_LIMIT = 20  # cap the summary's "other injuries" list for readability
+
+
+def _dumps(obj, indent: Optional[int] = None) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=indent, default=str).encode("utf-8")
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(obj):
+    """Write obj to stdout as indented JSON bytes, skipping the str round-trip."""
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(_dumps(obj, indent=2))
+    out.write(b"\n")
+    out.flush()
+
+
+# Working fields added to injury records while building a report; they are
+# removed before the records are returned to callers.
+_PRIVATE_FIELDS = ("_key", "_team_lower")
+
+
+def _team_lower(inj: dict) -> str:
+    """Return the casefolded team name, reusing the one cached by dedup."""
+    team_lower = inj.get("_team_lower")
+    if team_lower is None:
+        team_lower = inj["team"].casefold()
+    return team_lower
+
+
+def _injury_key(inj: dict) -> str:
+    """Return the casefolded player|team key, reusing the one cached by dedup."""
+    key = inj.get("_key")
+    if key is None:
+        key = f"{inj['player'].casefold()}|{_team_lower(inj)}"
+    return key
+
+
+def _strip_private_fields(injuries: list):
+    """Remove report-building working fields from injury records in place."""
+    for inj in injuries:
+        for field in _PRIVATE_FIELDS:
+            inj.pop(field, None)
 
 
 class InjuryReport:
@@ -29,7 +93,7 @@ class InjuryReport:
 
     def to_json(self, indent: int = 2) -> str:
         """Return the full report as formatted JSON."""
-        return json.dumps(self.data, indent=indent, default=str)
+        return _dumps(self.data, indent=indent).decode("utf-8")
 
     def to_dict(self) -> dict:
         """Return the report as a dict."""
@@ -37,10 +101,10 @@ class InjuryReport:
 
     def summary(self) -> str:
         """Return a human-readable summary of the injury report."""
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
         date_str = datetime.now(timezone.utc).strftime("%B %d, %Y")
-        lines.append(f"=== INJURY REPORT -- {date_str} ===")
-        lines.append("")
+        w(f"=== INJURY REPORT -- {date_str} ===\n\n")
 
         sports = self.data.get("sports", {})
         for sport, sport_data in sports.items():
@@ -48,77 +112,78 @@ class InjuryReport:
             games_today = sport_data.get("games_today", 0)
             affected_games = sport_data.get("affected_games", 0)
 
-            lines.append(
+            w(
                 f"--- {sport.upper()} ({len(injuries)} injuries, "
-                f"{affected_games} of {games_today} games affected) ---"
+                f"{affected_games} of {games_today} games affected) ---\n\n"
             )
-            lines.append("")
+
+            # Bucket injuries in one pass: a status change for a team playing
+            # today is listed under both the changes and today's sections.
+            # Only the displayed "other" injuries are kept; the rest are counted.
+            changes, today_by_team, other_shown = [], defaultdict(list), []
+            other_count = 0
+            for inj in injuries:
+                if inj.get("status_changed"):
+                    changes.append(inj)
+                if inj.get("game_today"):
+                    today_by_team[inj["team"]].append(inj)
+                elif not inj.get("status_changed"):
+                    other_count += 1
+                    if other_count <= OTHER_INJURIES_LIMIT:
+                        other_shown.append(inj)
 
             # Status changes first (most important)
-            changes = [i for i in injuries if i.get("status_changed")]
             if changes:
-                lines.append("** STATUS CHANGES **")
+                w("** STATUS CHANGES **\n")
                 for inj in changes:
                     old = inj.get("previous_status", "?")
                     new = inj.get("status", "?")
-                    lines.append(
+                    w(
                         f"  {inj['player']} ({inj['team']}) -- "
-                        f"{old} -> {new} -- {inj.get('injury', 'Undisclosed')}"
+                        f"{old} -> {new} -- {inj.get('injury', 'Undisclosed')}\n"
                     )
                     game = inj.get("game_today")
                     if game:
                         opp = game.get("opponent", "TBD")
                         time_str = game.get("time", "TBD")
-                        lines.append(f"    GAME TODAY: vs {opp} at {time_str}")
-                lines.append("")
-
-            # All injuries for teams playing today
-            today_injuries = [i for i in injuries if i.get("game_today")]
-            if today_injuries:
-                lines.append("** INJURIES (Teams Playing Today) **")
-                # Group by team
-                teams_seen = {}
-                for inj in today_injuries:
-                    team = inj["team"]
-                    if team not in teams_seen:
-                        teams_seen[team] = []
-                    teams_seen[team].append(inj)
-
-                for team, team_injuries in sorted(teams_seen.items()):
+                        w(f"    GAME TODAY: vs {opp} at {time_str}\n")
+                w("\n")
+
+            # All injuries for teams playing today, grouped by team
+            if today_by_team:
+                w("** INJURIES (Teams Playing Today) **\n")
+                for team, team_injuries in sorted(today_by_team.items()):
                     game = team_injuries[0].get("game_today", {})
                     opp = game.get("opponent", "TBD")
                     time_str = game.get("time", "TBD")
-                    lines.append(f"  {team} (vs {opp} at {time_str}):")
+                    w(f"  {team} (vs {opp} at {time_str}):\n")
                     for inj in team_injuries:
                         status = inj.get("status", "Unknown").upper()
-                        lines.append(
-                            f"    [{status}] {inj['player']} -- {inj.get('injury', 'Undisclosed')}"
-                        )
-                lines.append("")
+                        w(f"    [{status}] {inj['player']} -- {inj.get('injury', 'Undisclosed')}\n")
+                w("\n")
 
             # Remaining injuries (teams not playing today)
-            other_injuries = [i for i in injuries if not i.get("game_today") and not i.get("status_changed")]
-            if other_injuries:
-                lines.append(f"** OTHER INJURIES ({len(other_injuries)} players) **")
-                for inj in other_injuries[:20]:  # cap at 20 for readability
+            if other_count:
+                w(f"** OTHER INJURIES ({other_count} players) **\n")
+                for inj in other_shown:
                     status = inj.get("status", "Unknown").upper()
-                    lines.append(
+                    w(
                         f"  [{status}] {inj['player']} ({inj['team']}) -- "
-                        f"{inj.get('injury', 'Undisclosed')}"
+                        f"{inj.get('injury', 'Undisclosed')}\n"
                     )
-                if len(other_injuries) > 20:
-                    lines.append(f"  ... and {len(other_injuries) - 20} more")
-                lines.append("")
+                if other_count > OTHER_INJURIES_LIMIT:
+                    w(f"  ... and {other_count - OTHER_INJURIES_LIMIT} more\n")
+                w("\n")
 
         # Source status
         sources = self.data.get("source_status", {})
         ok_sources = [s for s, v in sources.items() if v.get("status") == "ok"]
         err_sources = [s for s, v in sources.items() if v.get("status") == "error"]
-        lines.append(f"Sources: {len(ok_sources)} succeeded, {len(err_sources)} failed")
+        w(f"Sources: {len(ok_sources)} succeeded, {len(err_sources)} failed")
         if err_sources:
-            lines.append(f"  Failed: {', '.join(err_sources)}")
+            w(f"\n  Failed: {', '.join(err_sources)}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 class InjuryMonitor:
@@ -148,28 +213,82 @@ class InjuryMonitor:
             state_path or os.environ.get("INJURY_STATE_PATH", DEFAULT_STATE_PATH)
         )
         self._team_game_map = None
+        self._nickname_index = None
+        self._todays_games_cache = {}
+        self._report_cache = {}
+        self._cache_date = None
 
     def _load_state(self) -> dict:
-        """Load last-known injury states from disk."""
+        """
+        Load last-known injury states from disk.
+
+        Keys are casefolded on load: older state files lowercased them, which
+        differs from casefold for a few non-ASCII names ("ß" -> "ss").
+        """
         if self.state_path.exists():
             try:
-                with open(self.state_path, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                state = _loads(self.state_path.read_bytes())
+                return {key.casefold(): entry for key, entry in state.items()}
+            # ValueError covers both codecs' JSONDecodeError and the
+            # UnicodeDecodeError stdlib json raises on non-UTF-8 bytes
+            except (ValueError, IOError) as e:
                 logger.warning("Failed to load state from %s: %s", self.state_path, e)
         return {}
 
     def _save_state(self, state: dict):
-        """Save current injury states to disk."""
+        """
+        Save current injury states to disk.
+
+        The state is written compactly (set INJURY_STATE_PRETTY=1 for indented
+        output) to a temporary file that then replaces the real one, so an
+        interrupted save never leaves a truncated state file behind. The
+        payload is serialized up front and handed to os.write whole, so a
+        typical save is one write(2) with no userspace buffering.
+        """
+        indent = 2 if os.environ.get("INJURY_STATE_PRETTY") == "1" else None
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
         try:
             self.state_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.state_path, "w") as f:
-                json.dump(state, f, indent=2, default=str)
+            payload = memoryview(_dumps(state, indent=indent))
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.state_path)
         except IOError as e:
             logger.error("Failed to save state to %s: %s", self.state_path, e)
 
+    def _expire_daily_caches(self):
+        """
+        Drop cached schedule data once the UTC date rolls over.
+
+        ShippClient fetches "today" by the UTC date, so the caches roll over
+        with the same ``%Y-%m-%d`` string rather than at local midnight.
+        """
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        if self._cache_date != today:
+            if self._cache_date is not None:
+                self.invalidate()
+            self._cache_date = today
+
+    def _todays_games(self, sport: str) -> list:
+        """Get today's games for a sport, fetching from Shipp at most once per day."""
+        self._expire_daily_caches()
+        games = self._todays_games_cache.get(sport)
+        if games is None:
+            games = self.shipp.get_todays_games(sport)
+            # An empty list may mean the schedule fetch failed, so only
+            # cache real results and retry on the next call otherwise.
+            if games:
+                self._todays_games_cache[sport] = games
+        return games
+
     def _get_team_game_map(self) -> dict:
         """Get or build the team-to-game mapping for today."""
+        self._expire_daily_caches()
         if self._team_game_map is None:
             try:
                 self._team_game_map = self.shipp.build_team_game_map()
@@ -178,13 +297,34 @@ class InjuryMonitor:
                 self._team_game_map = {}
         return self._team_game_map
 
+    def _get_nickname_index(self) -> dict:
+        """Get or build a last-word (team nickname) index over today's team map."""
+        team_game_map = self._get_team_game_map()
+        if self._nickname_index is None:
+            nickname_index = {}
+            shared = set()
+            for team_key, game_info in team_game_map.items():
+                key_parts = team_key.split()
+                if key_parts:
+                    nickname = key_parts[-1]
+                    if nickname in nickname_index:
+                        shared.add(nickname)
+                    nickname_index[nickname] = game_info
+            # A last word shared by several teams ("fc", "united", "city")
+            # identifies none of them; leave those to the substring scan.
+            for nickname in shared:
+                del nickname_index[nickname]
+            self._nickname_index = nickname_index
+        return self._nickname_index
+
     def _deduplicate_injuries(self, injuries: list) -> list:
         """
         Deduplicate injuries from multiple sources.
 
         When the same player appears in multiple sources, keep the record
-        with the most recent update time. If tied, prefer more authoritative
-        sources (official > ESPN > CBS).
+        from the most authoritative source (official > ESPN > CBS). If tied,
+        prefer the most recent update time, then the record listed first --
+        or listed last, when the update time only defaulted to the fetch time.
         """
         source_priority = {
             "nba_official": 3,
@@ -193,46 +333,69 @@ class InjuryMonitor:
             "cbs": 1,
         }
 
-        # Key by lowercase player name + team
-        seen = {}
-        for inj in injuries:
-            key = f"{inj['player'].lower()}|{inj['team'].lower()}"
-            existing = seen.get(key)
-            if existing is None:
-                seen[key] = inj
-            else:
-                # Prefer higher-priority source
-                existing_priority = source_priority.get(existing["source"], 0)
-                new_priority = source_priority.get(inj["source"], 0)
-                if new_priority > existing_priority:
-                    seen[key] = inj
-                elif new_priority == existing_priority:
-                    # Prefer more recent update
-                    if inj.get("updated", "") > existing.get("updated", ""):
-                        seen[key] = inj
-
-        return list(seen.values())
-
-    def _annotate_with_game_context(self, injuries: list) -> list:
-        """Add game_today info to injuries whose teams play today."""
-        team_game_map = self._get_team_game_map()
+        # Key by casefolded player name + team; rank by (priority, updated,
+        # order). Records on one page share a defaulted updated time (the
+        # page's fetched_at), so order keeps the last of those, as when each
+        # record had its own timestamp; explicit equal dates keep the first.
+        best = {}
+        for position, inj in enumerate(injuries):
+            # casefold matches the team keys of ShippClient.build_team_game_map;
+            # the player is folded the same way so the key is consistent
+            team_lower = inj["team"].casefold()
+            key = f"{inj['player'].casefold()}|{team_lower}"
+            inj["_key"] = key
+            inj["_team_lower"] = team_lower
+            updated = inj.get("updated", "")
+            rank = (
+                source_priority.get(inj["source"], 0),
+                updated,
+                position if updated == inj.get("fetched_at") else -position,
+            )
+            current = best.get(key)
+            if current is None or rank > current[0]:
+                best[key] = (rank, inj)
+
+        return [inj for _, inj in best.values()]
+
+    def _annotate_with_game_context(
+        self,
+        injuries: list,
+        team_game_map: Optional[dict] = None,
+        nickname_index: Optional[dict] = None,
+    ) -> list:
+        """
+        Add game_today info to injuries whose teams play today.
+
+        The team map and nickname index default to today's cached ones;
+        get_full_report passes the snapshot it built before fanning out.
+        """
+        if team_game_map is None:
+            team_game_map = self._get_team_game_map()
+        if not team_game_map:
+            # No games today (or the schedule fetch failed)
+            for inj in injuries:
+                inj["game_today"] = None
+            return injuries
+
+        if nickname_index is None:
+            nickname_index = self._get_nickname_index()
 
         for inj in injuries:
-            team_lower = inj["team"].lower()
+            team_lower = _team_lower(inj)
             game = team_game_map.get(team_lower)
 
             if game is None:
-                # Try partial matching (e.g., "Lakers" matches "Los Angeles Lakers")
+                # Try matching just the last word (e.g., "Lakers" matches "Los Angeles Lakers")
+                team_parts = team_lower.split()
+                if team_parts:
+                    game = nickname_index.get(team_parts[-1])
+
+            if game is None:
+                # Fall back to partial matching (e.g., "Man United" matches "Man United FC")
                 for team_key, game_info in team_game_map.items():
                     if team_lower in team_key or team_key in team_lower:
                         game = game_info
                         break
-                    # Also try matching just the last word (team nickname)
-                    team_parts = team_lower.split()
-                    key_parts = team_key.split()
-                    if team_parts and key_parts and team_parts[-1] == key_parts[-1]:
-                        game = game_info
-                        break
 
             if game:
                 inj["game_today"] = {
@@ -254,8 +417,7 @@ class InjuryMonitor:
         - previous_status (str or None)
         """
         for inj in current_injuries:
-            key = f"{inj['player'].lower()}|{inj['team'].lower()}"
-            prev = previous_state.get(key)
+            prev = previous_state.get(_injury_key(inj))
             if prev and prev.get("status") != inj["status"]:
                 inj["status_changed"] = True
                 inj["previous_status"] = prev["status"]
@@ -267,30 +429,139 @@ class InjuryMonitor:
 
     def _build_current_state(self, injuries_by_sport: dict) -> dict:
         """Build a state dict from current injuries for persistence."""
-        state = {}
-        for sport, injuries in injuries_by_sport.items():
-            for inj in injuries:
-                key = f"{inj['player'].lower()}|{inj['team'].lower()}"
-                state[key] = {
-                    "status": inj["status"],
-                    "injury": inj.get("injury", ""),
-                    "sport": sport,
-                    "last_seen": datetime.now(timezone.utc).isoformat(),
-                }
-        return state
+        now_iso = datetime.now(timezone.utc).isoformat()
+        # _injury_key reuses the key dedup already built (team casefolded once)
+        return {
+            _injury_key(inj): {
+                "status": inj["status"],
+                "injury": inj.get("injury", ""),
+                "sport": sport,
+                "last_seen": now_iso,
+            }
+            for sport, injuries in injuries_by_sport.items()
+            for inj in injuries
+        }
 
-    def get_full_report(self, sports: Optional[list] = None) -> InjuryReport:
+    def _state_delta(self, previous_state: dict, new_state: dict) -> dict:
+        """
+        Return the entries of new_state that differ from previous_state.
+
+        An entry counts as changed when its status, injury, or sport differs,
+        or when it was last seen on an earlier (UTC) day. Re-sightings on the
+        same day are not written back, so unchanged runs skip the save.
+        """
+        delta = {}
+        for key, entry in new_state.items():
+            prev = previous_state.get(key)
+            if (
+                prev is None
+                or prev.get("status") != entry["status"]
+                or prev.get("injury") != entry["injury"]
+                or prev.get("sport") != entry["sport"]
+                or prev.get("last_seen", "")[:10] != entry["last_seen"][:10]
+            ):
+                delta[key] = entry
+        return delta
+
+    def _process_sport(
+        self,
+        sport: str,
+        raw_data: dict,
+        previous_state: dict,
+        team_game_map: dict,
+        nickname_index: dict,
+        games_today: int,
+    ) -> dict:
+        """
+        Dedupe, annotate, and rank one sport's injuries into a report section.
+
+        Runs on a worker thread, so today's schedule data is passed in rather
+        than read from the daily caches, which a date rollover may clear.
+        """
+        sport_injuries = raw_data["injuries"].get(sport, [])
+
+        # Deduplicate across sources
+        deduped = self._deduplicate_injuries(sport_injuries)
+
+        # Add game context
+        annotated = self._annotate_with_game_context(
+            deduped, team_game_map, nickname_index
+        )
+
+        # Detect changes
+        with_changes = self._detect_changes(annotated, previous_state)
+
+        # Order: status changes first, then game-today injuries, then rest.
+        # Partition into those buckets and sort each one by player only.
+        changed_today, changed_other, today, other = [], [], [], []
+        for inj in with_changes:
+            if inj["status_changed"]:
+                bucket = changed_other if inj["game_today"] is None else changed_today
+            else:
+                bucket = other if inj["game_today"] is None else today
+            bucket.append(inj)
+        by_player = itemgetter("player")
+        for bucket in (changed_today, changed_other, today, other):
+            bucket.sort(key=by_player)
+        with_changes = changed_today + changed_other + today + other
+
+        # Count affected games
+        affected_game_ids = set()
+        for inj in with_changes:
+            if inj.get("game_today"):
+                affected_game_ids.add(inj["game_today"]["game_id"])
+        affected_games = len(affected_game_ids)
+
+        return {
+            "injuries": with_changes,
+            "total_injuries": len(with_changes),
+            "games_today": games_today,
+            "affected_games": affected_games,
+            "status_changes": len(changed_today) + len(changed_other),
+        }
+
+    def invalidate(self):
+        """
+        Drop cached reports and schedule lookups so the next request
+        refetches every source. The schedules themselves are still served
+        from ShippClient's cache while younger than its ``schedule_ttl``.
+        """
+        self._team_game_map = None
+        self._nickname_index = None
+        self._todays_games_cache.clear()
+        self._report_cache.clear()
+
+    def get_full_report(
+        self, sports: Optional[list] = None, persist: bool = True
+    ) -> InjuryReport:
         """
         Generate a complete injury report for all requested sports.
 
+        Reports are cached per set of sports for the rest of the day, so the
+        filtered accessors below reuse a single fetch. Call invalidate() to
+        force a fresh fetch (e.g. between polls in a long-running process).
+        A cached report built with persist=False still saves its state the
+        first time it is requested with persist=True.
+
         Args:
             sports: List of sports ('nba', 'mlb', 'soccer'). Defaults to all.
+            persist: Whether to save the current injury state to disk.
 
         Returns:
             InjuryReport object with full data, summary, and JSON output.
         """
         if sports is None:
-            sports = ["nba", "mlb", "soccer"]
+            sports = SUPPORTED_SPORTS
+
+        self._expire_daily_caches()
+        cache_key = tuple(sorted(sports))
+        cached = self._report_cache.get(cache_key)
+        if cached is not None:
+            report, unsaved_state = cached
+            if persist and unsaved_state is not None:
+                self._save_state(unsaved_state)
+                self._report_cache[cache_key] = (report, None)
+            return report
 
         # Load previous state for change detection
         previous_state = self._load_state()
@@ -298,56 +569,44 @@ class InjuryMonitor:
         # Fetch all injuries from all sources
         raw_data = fetch_all_injuries(sports=sports)
 
-        # Process each sport
-        report_sports = {}
-        all_injuries_for_state = {}
-
-        for sport in sports:
-            sport_injuries = raw_data["injuries"].get(sport, [])
-
-            # Deduplicate across sources
-            deduped = self._deduplicate_injuries(sport_injuries)
-
-            # Add game context
-            annotated = self._annotate_with_game_context(deduped)
-
-            # Detect changes
-            with_changes = self._detect_changes(annotated, previous_state)
-
-            # Sort: status changes first, then game-today injuries, then rest
-            with_changes.sort(
-                key=lambda x: (
-                    not x.get("status_changed", False),
-                    x.get("game_today") is None,
-                    x.get("player", ""),
-                )
-            )
-
-            # Count affected games
-            games_today = len([
-                g for g in self.shipp.get_todays_games(sport)
-            ]) if sport in sports else 0
-
-            affected_teams = set()
-            for inj in with_changes:
-                if inj.get("game_today"):
-                    affected_teams.add(inj["team"].lower())
-            affected_games = len(affected_teams) // 2 + len(affected_teams) % 2
-
-            report_sports[sport] = {
-                "injuries": with_changes,
-                "total_injuries": len(with_changes),
-                "games_today": games_today,
-                "affected_games": affected_games,
-                "status_changes": len([i for i in with_changes if i.get("status_changed")]),
-            }
-
-            all_injuries_for_state[sport] = with_changes
+        # Snapshot today's schedule lookups on this thread, then process each
+        # sport in parallel. The workers only read the snapshot and
+        # previous_state, so none of them touches the daily caches.
+        nickname_index = self._get_nickname_index()
+        team_game_map = self._team_game_map
+        games_today = {sport: len(self._todays_games(sport)) for sport in sports}
+        with ThreadPoolExecutor(max_workers=len(sports) or 1) as executor:
+            results = list(executor.map(
+                lambda sport: self._process_sport(
+                    sport, raw_data, previous_state,
+                    team_game_map, nickname_index, games_today[sport],
+                ),
+                sports,
+            ))
+
+        report_sports = dict(zip(sports, results))
+        all_injuries_for_state = {
+            sport: sport_data["injuries"] for sport, sport_data in report_sports.items()
+        }
 
         # Save current state for next run
         new_state = self._build_current_state(all_injuries_for_state)
-        merged_state = {**previous_state, **new_state}
-        self._save_state(merged_state)
+        for injuries in all_injuries_for_state.values():
+            _strip_private_fields(injuries)
+        delta = self._state_delta(previous_state, new_state)
+        cutoff = (
+            datetime.now(timezone.utc) - timedelta(days=STATE_RETENTION_DAYS)
+        ).isoformat()
+        retained = {
+            key: entry for key, entry in previous_state.items()
+            if entry.get("last_seen", "") >= cutoff
+        }
+        unsaved_state = None
+        if delta or len(retained) != len(previous_state):
+            unsaved_state = {**retained, **delta}
+            if persist:
+                self._save_state(unsaved_state)
+                unsaved_state = None
 
         report_data = {
             "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -355,31 +614,37 @@ class InjuryMonitor:
             "source_status": raw_data["sources"],
         }
 
-        return InjuryReport(report_data)
+        report = InjuryReport(report_data)
+        self._report_cache[cache_key] = (report, unsaved_state)
+        return report
 
-    def get_report(self, sport: str) -> InjuryReport:
+    def get_report(self, sport: str, persist: bool = True) -> InjuryReport:
         """
         Generate an injury report for a single sport.
 
         Args:
             sport: One of 'nba', 'mlb', 'soccer'.
+            persist: Whether to save the current injury state to disk.
 
         Returns:
             InjuryReport for the requested sport.
         """
-        return self.get_full_report(sports=[sport])
+        return self.get_full_report(sports=[sport], persist=persist)
 
-    def get_status_changes(self, sports: Optional[list] = None) -> list:
+    def get_status_changes(
+        self, sports: Optional[list] = None, persist: bool = True
+    ) -> list:
         """
         Get only the injuries that have changed status since last check.
 
         Args:
             sports: List of sports to check. Defaults to all.
+            persist: Whether to save the current injury state to disk.
 
         Returns:
             List of injury dicts that have status_changed=True.
         """
-        report = self.get_full_report(sports=sports)
+        report = self.get_full_report(sports=sports, persist=persist)
         changes = []
         for sport_data in report.data.get("sports", {}).values():
             for inj in sport_data.get("injuries", []):
@@ -387,17 +652,20 @@ class InjuryMonitor:
                     changes.append(inj)
         return changes
 
-    def get_today_impact(self, sports: Optional[list] = None) -> list:
+    def get_today_impact(
+        self, sports: Optional[list] = None, persist: bool = True
+    ) -> list:
         """
         Get only injuries affecting today's games.
 
         Args:
             sports: List of sports to check. Defaults to all.
+            persist: Whether to save the current injury state to disk.
 
         Returns:
             List of injury dicts where game_today is not None.
         """
-        report = self.get_full_report(sports=sports)
+        report = self.get_full_report(sports=sports, persist=persist)
         impact = []
         for sport_data in report.data.get("sports", {}).values():
             for inj in sport_data.get("injuries", []):
@@ -454,7 +722,7 @@ def main():
     if args.changes_only:
         changes = monitor.get_status_changes(sports=sports)
         if args.format == "json":
-            print(json.dumps(changes, indent=2, default=str))
+            _write_json(changes)
         else:
             if not changes:
                 print("No status changes detected since last check.")
@@ -471,7 +739,7 @@ def main():
     elif args.today_only:
         impact = monitor.get_today_impact(sports=sports)
         if args.format == "json":
-            print(json.dumps(impact, indent=2, default=str))
+            _write_json(impact)
         else:
             if not impact:
                 print("No injuries affecting today's games.")
@@ -487,7 +755,7 @@ def main():
     else:
         report = monitor.get_full_report(sports=sports)
         if args.format == "json":
-            print(report.to_json())
+            _write_json(report.data)
         else:
             print(report.summary())
 
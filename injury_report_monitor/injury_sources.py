@@ -6,18 +6,53 @@ information, and returns a standardized list of injury records. Parsers are
 independent -- one source failing does not affect others.
 """
 
+import functools
 import logging
+import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from datetime import datetime, timezone
+from urllib.parse import urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # optional speedup; fall back to the stdlib parser
+    HTML_PARSER = "html.parser"
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to response.json()
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 15
 POLITE_DELAY = 2.0  # seconds between requests to the same domain
+FETCH_WORKERS = 8  # concurrent source fetches in fetch_all_injuries
+MAX_CONCURRENT_REQUESTS = 5  # HTTP requests in flight at once, across sources
+HTTP_CACHE_MAX_AGE = 120  # seconds a fetched page is reused without revalidating
+
+# Per-host time of the most recently granted request slot (time.monotonic)
+_DOMAIN_LAST_FETCH: dict = {}
+_DOMAIN_LOCK = threading.Lock()
+
+# Held only around network I/O, so parsing never counts against the cap
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# url -> (stored at (time.monotonic), ETag, Last-Modified, parsed soup)
+_HTTP_CACHE: dict = {}
+
+# (parser, url) -> (soup the records came from, records)
+_PARSED_CACHE: dict = {}
 
 # Standard headers to mimic a normal browser request
 BROWSER_HEADERS = {
@@ -30,6 +65,33 @@ BROWSER_HEADERS = {
     "Accept-Language": "en-US,en;q=0.5",
 }
 
+
+def _make_session() -> requests.Session:
+    """
+    Build the shared HTTP session.
+
+    Browser headers are set once on the session rather than per request.
+    Connections are kept alive and pooled per host, so repeat fetches (e.g.
+    the four ESPN soccer leagues) skip the TCP/TLS handshake. Transient
+    connection errors and 502/503/504 responses are retried once with a
+    short backoff.
+    """
+    session = requests.Session()
+    session.headers.update(BROWSER_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=1, backoff_factor=0.5, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+
 # ESPN injury page URLs by sport
 ESPN_INJURY_URLS = {
     "nba": "https://www.espn.com/nba/injuries",
@@ -43,6 +105,38 @@ CBS_INJURY_URLS = {
     "mlb": "https://www.cbssports.com/mlb/injuries/",
 }
 
+# Class-name patterns for locating page sections. bs4 tests these against
+# each class of an element, matching the substring checks they replace.
+_INJURIES_CLASS_RE = re.compile("injuries", re.IGNORECASE)
+_TEAM_CLASS_RE = re.compile("team", re.IGNORECASE)
+_TEAM_OR_INJURY_CLASS_RE = re.compile("team|injury", re.IGNORECASE)
+_PLAYER_CLASS_RE = re.compile("player", re.IGNORECASE)
+_TABLEBASE_CLASS_RE = re.compile("TableBase")
+_TABLE_CLASS_RE = re.compile("Table")
+
+# Phrases in an MLB transaction description that introduce the injury
+_INJURY_MARKER_RE = re.compile(r"\b(?:with|due to|suffering from)\b", re.IGNORECASE)
+
+# IL-related MLB transaction types, lowercased for matching
+_IL_TYPES_LOWER = frozenset(t.lower() for t in (
+    "Placed on IL",
+    "Placed on 10-Day IL",
+    "Placed on 15-Day IL",
+    "Placed on 60-Day IL",
+    "Activated from IL",
+    "Activated from 10-Day IL",
+    "Activated from 15-Day IL",
+    "Activated from 60-Day IL",
+    "Transferred to 60-Day IL",
+))
+
+# MLB transaction status rules as one alternation; a lower group number
+# wins when several appear in the same transaction
+_MLB_STATUS_RE = re.compile(
+    r"(activated)|(60[-\s]day)|(15[-\s]day)|(10[-\s]day)", re.IGNORECASE
+)
+_MLB_STATUS_LABELS = (None, "active", "il-60", "il-15", "il-10")
+
 # Normalized injury statuses
 VALID_STATUSES = {
     "out", "doubtful", "questionable", "probable", "day-to-day",
@@ -50,40 +144,41 @@ VALID_STATUSES = {
 }
 
 
+# Raw status strings (stripped, lowercased) -> normalized status
+_STATUS_MAP = {
+    "out": "out",
+    "o": "out",
+    "doubtful": "doubtful",
+    "d": "doubtful",
+    "questionable": "questionable",
+    "q": "questionable",
+    "probable": "probable",
+    "p": "probable",
+    "day-to-day": "day-to-day",
+    "dtd": "day-to-day",
+    "day to day": "day-to-day",
+    "10-day il": "il-10",
+    "10-day injured list": "il-10",
+    "il-10": "il-10",
+    "15-day il": "il-15",
+    "15-day injured list": "il-15",
+    "il-15": "il-15",
+    "60-day il": "il-60",
+    "60-day injured list": "il-60",
+    "il-60": "il-60",
+    "injured list": "il-15",
+    "il": "il-15",
+    "suspended": "suspended",
+    "susp": "suspended",
+    "injured": "injured",
+    "inj": "injured",
+}
+
+
+@functools.lru_cache(maxsize=512)
 def _normalize_status(raw_status: str) -> str:
     """Normalize a raw injury status string to a standard value."""
-    status = raw_status.strip().lower()
-
-    status_map = {
-        "out": "out",
-        "o": "out",
-        "doubtful": "doubtful",
-        "d": "doubtful",
-        "questionable": "questionable",
-        "q": "questionable",
-        "probable": "probable",
-        "p": "probable",
-        "day-to-day": "day-to-day",
-        "dtd": "day-to-day",
-        "day to day": "day-to-day",
-        "10-day il": "il-10",
-        "10-day injured list": "il-10",
-        "il-10": "il-10",
-        "15-day il": "il-15",
-        "15-day injured list": "il-15",
-        "il-15": "il-15",
-        "60-day il": "il-60",
-        "60-day injured list": "il-60",
-        "il-60": "il-60",
-        "injured list": "il-15",
-        "il": "il-15",
-        "suspended": "suspended",
-        "susp": "suspended",
-        "injured": "injured",
-        "inj": "injured",
-    }
-
-    return status_map.get(status, "unknown")
+    return _STATUS_MAP.get(raw_status.strip().lower(), "unknown")
 
 
 def _make_injury_record(
@@ -94,44 +189,195 @@ def _make_injury_record(
     source: str,
     sport: str,
     updated: Optional[str] = None,
+    fetched_at: Optional[str] = None,
 ) -> dict:
-    """Create a standardized injury record."""
+    """
+    Create a standardized injury record.
+
+    Parsers pass one ``fetched_at`` timestamp for the whole page; it also
+    stands in for ``updated`` when the source gives no date.
+    """
+    fetched_at = fetched_at or datetime.now(timezone.utc).isoformat()
+    # Team, status, and source repeat across many records; interning them
+    # here lets dedup and grouping hash and compare one shared string.
     return {
         "player": player.strip(),
-        "team": team.strip(),
-        "status": _normalize_status(status),
+        "team": sys.intern(team.strip()),
+        "status": sys.intern(_normalize_status(status)),
         "raw_status": status.strip(),
         "injury": injury.strip() if injury else "Undisclosed",
-        "source": source,
+        "source": sys.intern(source),
         "sport": sport,
-        "updated": updated or datetime.now(timezone.utc).isoformat(),
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "updated": updated or fetched_at,
+        "fetched_at": fetched_at,
     }
 
 
-def _fetch_html(url: str, retry: bool = True) -> Optional[BeautifulSoup]:
+def _rate_limit(url: str) -> None:
+    """
+    Block until at least POLITE_DELAY seconds have passed since the last
+    request to the same host.
+
+    Slots are reserved under the lock and slept outside it, so concurrent
+    fetches to different hosts never wait on each other while fetches to
+    the same host are spaced POLITE_DELAY apart.
+    """
+    host = urlsplit(url).hostname or ""
+    with _DOMAIN_LOCK:
+        now = time.monotonic()
+        last = _DOMAIN_LAST_FETCH.get(host)
+        slot = now if last is None else max(now, last + POLITE_DELAY)
+        _DOMAIN_LAST_FETCH[host] = slot
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _page_encoding(response: requests.Response) -> str:
+    """
+    Return the encoding to decode a fetched page with.
+
+    Uses the charset from the Content-Type header, or UTF-8 when the header
+    names none -- every source serves UTF-8. Handing this to the parser
+    skips bs4's encoding detection over the raw bytes; bs4 still falls back
+    to detection if the bytes do not decode.
+    """
+    content_type = response.headers.get("Content-Type", "")
+    if "charset" not in content_type.lower():
+        return "utf-8"
+    return requests.utils.get_encoding_from_headers(response.headers)
+
+
+def _fetch_html(
+    url: str, max_age: float = HTTP_CACHE_MAX_AGE
+) -> Optional[BeautifulSoup]:
     """
     Fetch a URL and parse it as HTML.
 
+    Transient failures are retried by the session's transport adapter, so
+    the body is only parsed once. Parsed pages are cached in memory: a page
+    stored less than ``max_age`` seconds ago is returned without a request,
+    and an older one is revalidated with If-None-Match / If-Modified-Since
+    so an unchanged page (304) is not downloaded or parsed again.
+
     Args:
         url: The URL to fetch.
-        retry: Whether to retry once on failure.
+        max_age: Seconds a cached page is reused without revalidating.
 
     Returns:
         BeautifulSoup object or None if fetch failed.
     """
-    for attempt in range(2 if retry else 1):
-        try:
-            response = requests.get(
-                url, headers=BROWSER_HEADERS, timeout=DEFAULT_TIMEOUT
-            )
-            response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
-        except requests.exceptions.RequestException as e:
-            logger.warning("Fetch attempt %d failed for %s: %s", attempt + 1, url, e)
-            if attempt == 0 and retry:
-                time.sleep(5)
-    return None
+    cached = _HTTP_CACHE.get(url)
+    if cached is not None and time.monotonic() - cached[0] < max_age:
+        return cached[3]
+
+    # Browser headers live on the session; only validators are per request
+    headers = None
+    if cached is not None:
+        headers = {}
+        if cached[1]:
+            headers["If-None-Match"] = cached[1]
+        if cached[2]:
+            headers["If-Modified-Since"] = cached[2]
+
+    _rate_limit(url)
+    try:
+        with _REQUEST_SLOTS:
+            response = _SESSION.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        logger.warning("Fetch failed for %s: %s", url, e)
+        return None
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if response.status_code == 304 and cached is not None:
+        # A 304 need not repeat the validators; keep the cached ones
+        soup = cached[3]
+        etag = etag or cached[1]
+        last_modified = last_modified or cached[2]
+    else:
+        soup = BeautifulSoup(
+            response.content, HTML_PARSER,
+            from_encoding=_page_encoding(response),
+        )
+    _HTTP_CACHE[url] = (time.monotonic(), etag, last_modified, soup)
+    return soup
+
+
+def _reuse_parse(key: tuple, soup: BeautifulSoup, fetched_at: str) -> Optional[list]:
+    """
+    Return the records last parsed from ``soup`` under ``key``, if any.
+
+    _fetch_html hands back the very same soup object when a page is served
+    from its cache or revalidated with a 304, so an identity match means the
+    page is unchanged and need not be walked again. Records are copied with
+    the new ``fetched_at``; an ``updated`` that defaulted to the old fetch
+    time moves with it, while one taken from the page is kept.
+    """
+    hit = _PARSED_CACHE.get(key)
+    if hit is None or hit[0] is not soup:
+        return None
+    logger.debug("Page unchanged, reusing %d records for %s", len(hit[1]), key[-1])
+    return [
+        dict(
+            r,
+            fetched_at=fetched_at,
+            updated=fetched_at if r["updated"] == r["fetched_at"] else r["updated"],
+        )
+        for r in hit[1]
+    ]
+
+
+def _remember_parse(key: tuple, soup: BeautifulSoup, injuries: list) -> None:
+    """Store copies of freshly parsed records for _reuse_parse."""
+    _PARSED_CACHE[key] = (soup, [dict(r) for r in injuries])
+
+
+def _cell_texts(row) -> list:
+    """Return the stripped text of each direct <td> child of a table row."""
+    return [td.get_text(strip=True) for td in row.find_all("td", recursive=False)]
+
+
+def _has_class(el: Tag, pattern: re.Pattern) -> bool:
+    """Match a class pattern the way bs4's ``class_=`` filter does."""
+    classes = el.get("class")
+    if not classes:
+        return False
+    if any(pattern.search(c) for c in classes):
+        return True
+    return len(classes) > 1 and bool(pattern.search(" ".join(classes)))
+
+
+def _labels_before(soup: BeautifulSoup, sections: list, matchers: list) -> list:
+    """
+    Find the label element preceding each section in a single forward walk.
+
+    Equivalent to ``section.find_previous(m1) or section.find_previous(m2)
+    or ...`` for every section, without a backward scan of the document per
+    call. Each matcher is ``(tag_names, class_pattern_or_None)``.
+
+    Returns:
+        A list parallel to ``sections`` holding the matched Tag or None.
+    """
+    pending = {id(section): i for i, section in enumerate(sections)}
+    last = [None] * len(matchers)
+    labels = [None] * len(sections)
+    for el in soup.descendants:
+        if not isinstance(el, Tag):
+            continue
+        i = pending.get(id(el))
+        if i is not None:
+            labels[i] = next((m for m in last if m is not None), None)
+        for j, (names, pattern) in enumerate(matchers):
+            if el.name in names and (pattern is None or _has_class(el, pattern)):
+                last[j] = el
+    return labels
+
+
+def _nba_row_texts(row) -> list:
+    """Return the stripped text of a row's first three <td> (or <span>) cells."""
+    cells = row.find_all("td") or row.find_all("span")
+    return [cell.get_text(strip=True) for cell in cells[:3]]
 
 
 # ---------------------------------------------------------------------------
@@ -162,6 +408,11 @@ def parse_espn_injuries(sport: str) -> list:
         logger.error("Failed to fetch ESPN %s injury page", sport.upper())
         return []
 
+    fetched_at = datetime.now(timezone.utc).isoformat()
+    reused = _reuse_parse(("espn", url), soup, fetched_at)
+    if reused is not None:
+        return reused
+
     injuries = []
     current_team = "Unknown"
 
@@ -169,7 +420,7 @@ def parse_espn_injuries(sport: str) -> list:
     # The exact HTML structure may change, so we use multiple strategies.
 
     # Strategy 1: Look for team sections with injury tables
-    team_sections = soup.find_all("div", class_=lambda c: c and "injuries" in c.lower()) or \
+    team_sections = soup.find_all("div", class_=_INJURIES_CLASS_RE) or \
                     soup.find_all("section") or \
                     soup.find_all("div", class_="ResponsiveTable")
 
@@ -178,70 +429,53 @@ def parse_espn_injuries(sport: str) -> list:
         team_header = (
             section.find("h2") or
             section.find("h3") or
-            section.find("span", class_=lambda c: c and "team" in c.lower() if c else False)
+            section.find("span", class_=_TEAM_CLASS_RE)
         )
         if team_header:
             current_team = team_header.get_text(strip=True)
 
-        # Find all table rows in this section
-        rows = section.find_all("tr")
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) >= 3:
-                player_name = cells[0].get_text(strip=True)
-                # Skip header rows
-                if player_name.lower() in ("name", "player", ""):
-                    continue
-
-                status_text = cells[1].get_text(strip=True) if len(cells) > 1 else "Unknown"
-                injury_desc = cells[2].get_text(strip=True) if len(cells) > 2 else "Undisclosed"
-
-                # Extract date if present (usually in a 4th column)
-                updated = None
-                if len(cells) > 3:
-                    date_text = cells[3].get_text(strip=True)
-                    if date_text:
-                        updated = date_text
-
-                injuries.append(_make_injury_record(
-                    player=player_name,
-                    team=current_team,
-                    status=status_text,
-                    injury=injury_desc,
-                    source="espn",
-                    sport=sport,
-                    updated=updated,
-                ))
+        # Player rows in this section, skipping header rows; the date, if
+        # present, is usually in a 4th column
+        injuries.extend([
+            _make_injury_record(
+                player=cells[0],
+                team=current_team,
+                status=cells[1],
+                injury=cells[2],
+                source="espn",
+                sport=sport,
+                fetched_at=fetched_at,
+                updated=cells[3] if len(cells) > 3 and cells[3] else None,
+            )
+            for cells in map(_cell_texts, section.find_all("tr"))
+            if len(cells) >= 3 and cells[0].lower() not in ("name", "player", "")
+        ])
 
     # Strategy 2: If no structured tables found, try flat table parsing
     if not injuries:
         all_tables = soup.find_all("table")
-        for table in all_tables:
-            # Check preceding header for team name
-            prev = table.find_previous(["h2", "h3", "h4"])
+        headers = _labels_before(soup, all_tables, [(("h2", "h3", "h4"), None)])
+        for table, prev in zip(all_tables, headers):
+            # Preceding header holds the team name
             if prev:
                 current_team = prev.get_text(strip=True)
 
-            rows = table.find_all("tr")
-            for row in rows:
-                cells = row.find_all("td")
-                if len(cells) >= 2:
-                    player_name = cells[0].get_text(strip=True)
-                    if player_name.lower() in ("name", "player", ""):
-                        continue
-                    status_text = cells[1].get_text(strip=True) if len(cells) > 1 else "Unknown"
-                    injury_desc = cells[2].get_text(strip=True) if len(cells) > 2 else "Undisclosed"
-
-                    injuries.append(_make_injury_record(
-                        player=player_name,
-                        team=current_team,
-                        status=status_text,
-                        injury=injury_desc,
-                        source="espn",
-                        sport=sport,
-                    ))
+            injuries.extend([
+                _make_injury_record(
+                    player=cells[0],
+                    team=current_team,
+                    status=cells[1],
+                    injury=cells[2] if len(cells) > 2 else "Undisclosed",
+                    source="espn",
+                    sport=sport,
+                    fetched_at=fetched_at,
+                )
+                for cells in map(_cell_texts, table.find_all("tr"))
+                if len(cells) >= 2 and cells[0].lower() not in ("name", "player", "")
+            ])
 
     logger.info("Parsed %d injuries from ESPN %s", len(injuries), sport.upper())
+    _remember_parse(("espn", url), soup, injuries)
     return injuries
 
 
@@ -267,60 +501,50 @@ def parse_cbs_injuries(sport: str) -> list:
         return []
 
     logger.info("Fetching CBS Sports %s injuries from %s", sport.upper(), url)
-    time.sleep(POLITE_DELAY)  # polite delay before CBS after ESPN
     soup = _fetch_html(url)
     if soup is None:
         logger.error("Failed to fetch CBS Sports %s injury page", sport.upper())
         return []
 
+    fetched_at = datetime.now(timezone.utc).isoformat()
+    reused = _reuse_parse(("cbs", url), soup, fetched_at)
+    if reused is not None:
+        return reused
+
     injuries = []
     current_team = "Unknown"
 
     # CBS Sports uses TableBase components with team headers
-    team_sections = soup.find_all("div", class_=lambda c: c and "TableBase" in c if c else False) or \
+    team_sections = soup.find_all("div", class_=_TABLEBASE_CLASS_RE) or \
                     soup.find_all("table")
 
-    for section in team_sections:
-        # Find team name
-        team_el = (
-            section.find_previous("h4") or
-            section.find_previous("h3") or
-            section.find_previous("a", class_=lambda c: c and "team" in c.lower() if c else False)
-        )
+    team_labels = _labels_before(
+        soup, team_sections,
+        [(("h4",), None), (("h3",), None), (("a",), _TEAM_CLASS_RE)],
+    )
+    for section, team_el in zip(team_sections, team_labels):
         if team_el:
             current_team = team_el.get_text(strip=True)
 
-        rows = section.find_all("tr")
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) >= 3:
-                player_name = cells[0].get_text(strip=True)
-                if not player_name or player_name.lower() in ("player", "name"):
-                    continue
-
-                # CBS typically has: Player | Position | Updated | Injury | Status
-                if len(cells) >= 5:
-                    injury_desc = cells[3].get_text(strip=True)
-                    status_text = cells[4].get_text(strip=True)
-                    updated = cells[2].get_text(strip=True)
-                elif len(cells) >= 3:
-                    status_text = cells[1].get_text(strip=True)
-                    injury_desc = cells[2].get_text(strip=True)
-                    updated = None
-                else:
-                    continue
-
-                injuries.append(_make_injury_record(
-                    player=player_name,
-                    team=current_team,
-                    status=status_text,
-                    injury=injury_desc,
-                    source="cbs",
-                    sport=sport,
-                    updated=updated,
-                ))
+        # CBS typically has: Player | Position | Updated | Injury | Status;
+        # narrower tables are Player | Status | Injury
+        injuries.extend([
+            _make_injury_record(
+                player=cells[0],
+                team=current_team,
+                status=cells[4] if len(cells) >= 5 else cells[1],
+                injury=cells[3] if len(cells) >= 5 else cells[2],
+                source="cbs",
+                sport=sport,
+                fetched_at=fetched_at,
+                updated=cells[2] if len(cells) >= 5 else None,
+            )
+            for cells in map(_cell_texts, section.find_all("tr"))
+            if len(cells) >= 3 and cells[0].lower() not in ("player", "name", "")
+        ])
 
     logger.info("Parsed %d injuries from CBS Sports %s", len(injuries), sport.upper())
+    _remember_parse(("cbs", url), soup, injuries)
     return injuries
 
 
@@ -341,19 +565,23 @@ def parse_nba_injury_report() -> list:
     """
     url = "https://www.nba.com/players/injuries"
     logger.info("Fetching official NBA injury report from %s", url)
-    time.sleep(POLITE_DELAY)
     soup = _fetch_html(url)
     if soup is None:
         logger.error("Failed to fetch NBA official injury report")
         return []
 
+    fetched_at = datetime.now(timezone.utc).isoformat()
+    reused = _reuse_parse(("nba_official", url), soup, fetched_at)
+    if reused is not None:
+        return reused
+
     injuries = []
     current_team = "Unknown"
 
     # NBA.com injury page structure
     # Look for player injury cards or table rows
     team_containers = soup.find_all(
-        "div", class_=lambda c: c and ("team" in c.lower() or "injury" in c.lower()) if c else False
+        "div", class_=_TEAM_OR_INJURY_CLASS_RE
     )
 
     for container in team_containers:
@@ -362,51 +590,45 @@ def parse_nba_injury_report() -> list:
             current_team = team_el.get_text(strip=True)
 
         rows = container.find_all("tr") or container.find_all(
-            "div", class_=lambda c: c and "player" in c.lower() if c else False
+            "div", class_=_PLAYER_CLASS_RE
         )
-        for row in rows:
-            cells = row.find_all("td") or row.find_all("span")
-            if len(cells) >= 2:
-                player_name = cells[0].get_text(strip=True)
-                if not player_name or player_name.lower() in ("player", "name"):
-                    continue
-                status_text = cells[1].get_text(strip=True) if len(cells) > 1 else "Unknown"
-                injury_desc = cells[2].get_text(strip=True) if len(cells) > 2 else "Undisclosed"
-
-                injuries.append(_make_injury_record(
-                    player=player_name,
-                    team=current_team,
-                    status=status_text,
-                    injury=injury_desc,
-                    source="nba_official",
-                    sport="nba",
-                ))
+        injuries.extend([
+            _make_injury_record(
+                player=cells[0],
+                team=current_team,
+                status=cells[1],
+                injury=cells[2] if len(cells) > 2 else "Undisclosed",
+                source="nba_official",
+                sport="nba",
+                fetched_at=fetched_at,
+            )
+            for cells in map(_nba_row_texts, rows)
+            if len(cells) >= 2 and cells[0].lower() not in ("player", "name", "")
+        ])
 
     # Fallback: try the general table approach
     if not injuries:
         tables = soup.find_all("table")
-        for table in tables:
-            prev = table.find_previous(["h2", "h3", "h4"])
+        headers = _labels_before(soup, tables, [(("h2", "h3", "h4"), None)])
+        for table, prev in zip(tables, headers):
             if prev:
                 current_team = prev.get_text(strip=True)
-            for row in table.find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) >= 2:
-                    player_name = cells[0].get_text(strip=True)
-                    if not player_name or player_name.lower() in ("player", "name"):
-                        continue
-                    status_text = cells[1].get_text(strip=True)
-                    injury_desc = cells[2].get_text(strip=True) if len(cells) > 2 else "Undisclosed"
-                    injuries.append(_make_injury_record(
-                        player=player_name,
-                        team=current_team,
-                        status=status_text,
-                        injury=injury_desc,
-                        source="nba_official",
-                        sport="nba",
-                    ))
+            injuries.extend([
+                _make_injury_record(
+                    player=cells[0],
+                    team=current_team,
+                    status=cells[1],
+                    injury=cells[2] if len(cells) > 2 else "Undisclosed",
+                    source="nba_official",
+                    sport="nba",
+                    fetched_at=fetched_at,
+                )
+                for cells in map(_cell_texts, table.find_all("tr"))
+                if len(cells) >= 2 and cells[0].lower() not in ("player", "name", "")
+            ])
 
     logger.info("Parsed %d injuries from NBA official report", len(injuries))
+    _remember_parse(("nba_official", url), soup, injuries)
     return injuries
 
 
@@ -426,48 +648,43 @@ def parse_mlb_transactions() -> list:
         List of standardized injury record dicts.
     """
     url = "https://statsapi.mlb.com/api/v1/transactions"
-    params = {
-        "startDate": datetime.now(timezone.utc).strftime("%m/%d/%Y"),
-        "endDate": datetime.now(timezone.utc).strftime("%m/%d/%Y"),
-    }
+    today = datetime.now(timezone.utc).strftime("%m/%d/%Y")
+    params = {"startDate": today, "endDate": today}
 
     logger.info("Fetching MLB transactions from %s", url)
-    time.sleep(POLITE_DELAY)
+    _rate_limit(url)
 
     try:
-        response = requests.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+        with _REQUEST_SLOTS:
+            response = _SESSION.get(url, params=params, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.RequestException as e:
+        # orjson decodes the raw bytes directly, skipping the text decode
+        if orjson is not None:
+            data = orjson.loads(response.content)
+        else:
+            response.encoding = "utf-8"  # skip requests' encoding guess
+            data = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
         logger.error("Failed to fetch MLB transactions: %s", e)
         return []
 
+    fetched_at = datetime.now(timezone.utc).isoformat()
+
     injuries = []
     transactions = data.get("transactions", [])
 
-    # IL-related transaction type codes
-    il_types = {
-        "Placed on IL",
-        "Placed on 10-Day IL",
-        "Placed on 15-Day IL",
-        "Placed on 60-Day IL",
-        "Activated from IL",
-        "Activated from 10-Day IL",
-        "Activated from 15-Day IL",
-        "Activated from 60-Day IL",
-        "Transferred to 60-Day IL",
-    }
-
     for txn in transactions:
         description = txn.get("description", "")
         type_desc = txn.get("typeDesc", "")
+        desc_lower = description.lower()
+        type_lower = type_desc.lower()
 
         # Filter for IL-related transactions
         is_il_related = (
-            type_desc in il_types or
-            "injured list" in description.lower() or
-            "il" in type_desc.lower() or
-            "disabled list" in description.lower()
+            type_lower in _IL_TYPES_LOWER or
+            "injured list" in desc_lower or
+            "il" in type_lower or
+            "disabled list" in desc_lower
         )
 
         if not is_il_related:
@@ -480,36 +697,31 @@ def parse_mlb_transactions() -> list:
         effective_date = txn.get("effectiveDate", "")
 
         # Determine status from transaction type
-        if "activated" in type_desc.lower() or "activated" in description.lower():
-            status = "active"
-        elif "60-day" in type_desc.lower() or "60-day" in description.lower():
-            status = "il-60"
-        elif "15-day" in type_desc.lower() or "15-day" in description.lower():
-            status = "il-15"
-        elif "10-day" in type_desc.lower() or "10-day" in description.lower():
-            status = "il-10"
+        best = 0
+        for m in _MLB_STATUS_RE.finditer(type_desc + " " + description):
+            if not best or m.lastindex < best:
+                best = m.lastindex
+                if best == 1:
+                    break
+        status = _MLB_STATUS_LABELS[best] if best else "il-15"  # default IL type
+
+        # Extract just the injury part of the transaction description
+        marker = _INJURY_MARKER_RE.search(description)
+        if marker:
+            injury_desc = description[marker.end():].strip().rstrip(".")
         else:
-            status = "il-15"  # default IL type
-
-        # Extract injury description from transaction description
-        injury_desc = description
-        # Try to extract just the injury part
-        for marker in ["with", "due to", "suffering from"]:
-            if marker in description.lower():
-                idx = description.lower().index(marker)
-                injury_desc = description[idx + len(marker):].strip().rstrip(".")
-                break
+            injury_desc = description
 
         injuries.append({
             "player": player_name,
-            "team": team_name,
+            "team": sys.intern(team_name),
             "status": status,
             "raw_status": type_desc,
             "injury": injury_desc or "Undisclosed",
             "source": "mlb_transactions",
             "sport": "mlb",
             "updated": effective_date,
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "fetched_at": fetched_at,
         })
 
     logger.info("Parsed %d IL transactions from MLB wire", len(injuries))
@@ -520,6 +732,23 @@ def parse_mlb_transactions() -> list:
 # Soccer Injury Parsers
 # ---------------------------------------------------------------------------
 
+def _soccer_record(cells: list, team: str, league: str, fetched_at: str) -> dict:
+    """Build a record from a soccer table row: Player | Status | Injury | Return."""
+    record = _make_injury_record(
+        player=cells[0],
+        team=team,
+        status=cells[1],
+        injury=cells[2] if len(cells) > 2 else "Undisclosed",
+        source="espn",
+        sport="soccer",
+        fetched_at=fetched_at,
+    )
+    if len(cells) > 3 and cells[3]:
+        record["expected_return"] = cells[3]
+    record["league"] = league
+    return record
+
+
 def parse_soccer_injuries(league: str = "premier-league") -> list:
     """
     Fetch soccer injury data from public sources.
@@ -548,55 +777,40 @@ def parse_soccer_injuries(league: str = "premier-league") -> list:
         logger.warning("Unknown league '%s', falling back to generic ESPN soccer", league)
 
     logger.info("Fetching soccer injuries for %s from %s", league, url)
-    time.sleep(POLITE_DELAY)
     soup = _fetch_html(url)
     if soup is None:
         logger.error("Failed to fetch soccer injuries for %s", league)
         return []
 
+    fetched_at = datetime.now(timezone.utc).isoformat()
+    # Unknown leagues share the fallback URL, so the league is part of the key
+    parse_key = ("espn_soccer", league, url)
+    reused = _reuse_parse(parse_key, soup, fetched_at)
+    if reused is not None:
+        return reused
+
     injuries = []
     current_team = "Unknown"
 
     # Parse team-by-team injury tables
-    sections = soup.find_all("div", class_=lambda c: c and "Table" in c if c else False) or \
+    sections = soup.find_all("div", class_=_TABLE_CLASS_RE) or \
                soup.find_all("table")
 
-    for section in sections:
-        team_el = (
-            section.find_previous("h2") or
-            section.find_previous("h3") or
-            section.find_previous("caption")
-        )
+    team_labels = _labels_before(
+        soup, sections, [(("h2",), None), (("h3",), None), (("caption",), None)]
+    )
+    for section, team_el in zip(sections, team_labels):
         if team_el:
             current_team = team_el.get_text(strip=True)
 
-        rows = section.find_all("tr")
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) >= 2:
-                player_name = cells[0].get_text(strip=True)
-                if not player_name or player_name.lower() in ("player", "name", ""):
-                    continue
-
-                status_text = cells[1].get_text(strip=True) if len(cells) > 1 else "Injured"
-                injury_desc = cells[2].get_text(strip=True) if len(cells) > 2 else "Undisclosed"
-                expected_return = cells[3].get_text(strip=True) if len(cells) > 3 else None
-
-                record = _make_injury_record(
-                    player=player_name,
-                    team=current_team,
-                    status=status_text,
-                    injury=injury_desc,
-                    source="espn",
-                    sport="soccer",
-                )
-                if expected_return:
-                    record["expected_return"] = expected_return
-                record["league"] = league
-
-                injuries.append(record)
+        injuries.extend([
+            _soccer_record(cells, current_team, league, fetched_at)
+            for cells in map(_cell_texts, section.find_all("tr"))
+            if len(cells) >= 2 and cells[0].lower() not in ("player", "name", "")
+        ])
 
     logger.info("Parsed %d injuries for soccer/%s", len(injuries), league)
+    _remember_parse(parse_key, soup, injuries)
     return injuries
 
 
@@ -629,75 +843,42 @@ def fetch_all_injuries(sports: Optional[list] = None) -> dict:
     all_injuries = {sport: [] for sport in sports}
     source_status = {}
 
-    # NBA sources
+    # Fetch every source concurrently. Requests to the same host (the ESPN
+    # pages) are still spaced by _rate_limit, but one page is parsed while
+    # the next waits for its slot. Results are gathered in task order so the
+    # merged record order does not depend on which response arrives first.
+    tasks = []
     if "nba" in sports:
-        # ESPN NBA
-        try:
-            espn_nba = parse_espn_injuries("nba")
-            all_injuries["nba"].extend(espn_nba)
-            source_status["espn_nba"] = {"status": "ok", "count": len(espn_nba)}
-        except Exception as e:
-            logger.error("ESPN NBA parser failed: %s", e)
-            source_status["espn_nba"] = {"status": "error", "error": str(e)}
-
-        # CBS NBA
-        try:
-            cbs_nba = parse_cbs_injuries("nba")
-            all_injuries["nba"].extend(cbs_nba)
-            source_status["cbs_nba"] = {"status": "ok", "count": len(cbs_nba)}
-        except Exception as e:
-            logger.error("CBS NBA parser failed: %s", e)
-            source_status["cbs_nba"] = {"status": "error", "error": str(e)}
-
-        # Official NBA injury report
-        try:
-            nba_official = parse_nba_injury_report()
-            all_injuries["nba"].extend(nba_official)
-            source_status["nba_official"] = {"status": "ok", "count": len(nba_official)}
-        except Exception as e:
-            logger.error("NBA official parser failed: %s", e)
-            source_status["nba_official"] = {"status": "error", "error": str(e)}
-
-    # MLB sources
+        tasks += [
+            ("espn_nba", "nba", "ESPN NBA", parse_espn_injuries, ("nba",)),
+            ("cbs_nba", "nba", "CBS NBA", parse_cbs_injuries, ("nba",)),
+            ("nba_official", "nba", "NBA official", parse_nba_injury_report, ()),
+        ]
     if "mlb" in sports:
-        # ESPN MLB
-        try:
-            espn_mlb = parse_espn_injuries("mlb")
-            all_injuries["mlb"].extend(espn_mlb)
-            source_status["espn_mlb"] = {"status": "ok", "count": len(espn_mlb)}
-        except Exception as e:
-            logger.error("ESPN MLB parser failed: %s", e)
-            source_status["espn_mlb"] = {"status": "error", "error": str(e)}
-
-        # CBS MLB
-        try:
-            cbs_mlb = parse_cbs_injuries("mlb")
-            all_injuries["mlb"].extend(cbs_mlb)
-            source_status["cbs_mlb"] = {"status": "ok", "count": len(cbs_mlb)}
-        except Exception as e:
-            logger.error("CBS MLB parser failed: %s", e)
-            source_status["cbs_mlb"] = {"status": "error", "error": str(e)}
-
-        # MLB Transactions
-        try:
-            mlb_txns = parse_mlb_transactions()
-            all_injuries["mlb"].extend(mlb_txns)
-            source_status["mlb_transactions"] = {"status": "ok", "count": len(mlb_txns)}
-        except Exception as e:
-            logger.error("MLB transactions parser failed: %s", e)
-            source_status["mlb_transactions"] = {"status": "error", "error": str(e)}
-
-    # Soccer sources
+        tasks += [
+            ("espn_mlb", "mlb", "ESPN MLB", parse_espn_injuries, ("mlb",)),
+            ("cbs_mlb", "mlb", "CBS MLB", parse_cbs_injuries, ("mlb",)),
+            ("mlb_transactions", "mlb", "MLB transactions", parse_mlb_transactions, ()),
+        ]
     if "soccer" in sports:
-        for league in ["premier-league", "la-liga", "champions-league", "mls"]:
-            source_key = f"espn_soccer_{league}"
+        tasks += [
+            (f"espn_soccer_{league}", "soccer", f"Soccer {league}",
+             parse_soccer_injuries, (league,))
+            for league in ["premier-league", "la-liga", "champions-league", "mls"]
+        ]
+
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(tasks))) as executor:
+            futures = [executor.submit(fn, *args) for _, _, _, fn, args in tasks]
+        for (source_key, sport, label, _, _), future in zip(tasks, futures):
             try:
-                soccer_injuries = parse_soccer_injuries(league)
-                all_injuries["soccer"].extend(soccer_injuries)
-                source_status[source_key] = {"status": "ok", "count": len(soccer_injuries)}
+                records = future.result()
             except Exception as e:
-                logger.error("Soccer %s parser failed: %s", league, e)
+                logger.error("%s parser failed: %s", label, e)
                 source_status[source_key] = {"status": "error", "error": str(e)}
+                continue
+            all_injuries[sport].extend(records)
+            source_status[source_key] = {"status": "ok", "count": len(records)}
 
     return {
         "injuries": all_injuries,
@@ -5,20 +5,42 @@ Provides today's schedule so the injury monitor knows which games are
 happening and can flag relevant injuries as high-priority.
 """
 
+import functools
 import os
+import random
+import sys
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to response.json()
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 SHIPP_BASE_URL = "https://api.shipp.ai/api/v1"
 DEFAULT_TIMEOUT = 15
-MAX_RETRIES = 2
-RETRY_BACKOFF = 2.0
+RETRY_DEADLINE = 30.0  # seconds across all attempts of one request
+RETRY_BACKOFF = 0.5  # first backoff ceiling; doubles per attempt
+RETRY_BACKOFF_MAX = 5.0
+SCHEDULE_TTL = 300  # seconds; override with SHIPP_SCHEDULE_TTL
+LIVE_SCORES_TTL = 10  # seconds; override with SHIPP_LIVE_SCORES_TTL
+SUPPORTED_SPORTS = ("nba", "mlb", "soccer")
+
+# Live-connection filter instructions by sport
+_LIVE_FILTER_INSTRUCTIONS = {
+    "nba": "Track all NBA games today with live scores and injury updates",
+    "mlb": "Track all MLB games today with live scores and roster transactions",
+    "soccer": "Track all soccer matches today with live scores and squad updates",
+}
 
 
 class ShippClient:
@@ -31,59 +53,116 @@ class ShippClient:
                 "SHIPP_API_KEY is required. Set it as an environment variable "
                 "or pass it to ShippClient(api_key='...'). "
             )
+        self.schedule_ttl = float(os.environ.get("SHIPP_SCHEDULE_TTL", SCHEDULE_TTL))
+        self.live_scores_ttl = float(
+            os.environ.get("SHIPP_LIVE_SCORES_TTL", LIVE_SCORES_TTL)
+        )
+        # key -> (stored at (time.monotonic), response)
+        self._schedule_cache = {}
+        self._live_scores_cache = {}
+        self._cache_lock = threading.Lock()
+        # Request URLs are self._base + endpoint; the key rides on session.params
+        self._base = SHIPP_BASE_URL
+        # Signature of the schedule behind the last team map, and the map
+        self._last_map_key = None
+        self._last_team_map = None
         self.session = requests.Session()
         self.session.headers.update({
             "Content-Type": "application/json",
             "User-Agent": "injury-report-monitor/1.0",
         })
-
-    def _url(self, endpoint: str) -> str:
-        """Build URL with api_key query parameter."""
-        sep = "&" if "?" in endpoint else "?"
-        return f"{SHIPP_BASE_URL}{endpoint}{sep}api_key={self.api_key}"
+        # Every request inherits the key; requests merges per-call params in
+        self.session.params = {"api_key": self.api_key}
+        # Keep enough pooled connections for the concurrent schedule and
+        # live-score fan-outs; retries stay in _request (429/5xx policy).
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _cached(self, cache: dict, key, ttl: float, fetch):
+        """Return cache[key] if younger than ttl seconds, else fetch and store it."""
+        with self._cache_lock:
+            hit = cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+        value = fetch()
+        with self._cache_lock:
+            cache[key] = (time.monotonic(), value)
+        return value
 
     def _request(self, method: str, endpoint: str, **kwargs) -> dict:
-        """Make an API request with retry logic."""
-        url = self._url(endpoint)
+        """
+        Make an API request with retry logic.
+
+        Timeouts, connection errors, 5xx responses and 429s are retried until
+        RETRY_DEADLINE seconds have passed. Waits use exponential backoff
+        with full jitter (or the server's Retry-After on a 429), so
+        concurrent callers do not retry in lockstep. Other 4xx responses
+        raise RuntimeError immediately.
+        """
+        url = self._base + endpoint
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
 
-        last_error = None
-        for attempt in range(MAX_RETRIES + 1):
+        deadline = time.monotonic() + RETRY_DEADLINE
+        # (format, args) of the latest failure, only rendered if we give up
+        last_error = ("no attempt made", ())
+        attempt = 0
+        while True:
+            attempt += 1
+            delay = None
             try:
-                response = self.session.request(method, url, **kwargs)
-
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 5))
-                    logger.warning(
-                        "Rate limited by Shipp API, waiting %d seconds", retry_after
-                    )
-                    time.sleep(retry_after)
-                    continue
-
-                response.raise_for_status()
-                return response.json()
+                # Closing the response hands its connection straight back to
+                # the pool, so chained calls (e.g. the live-score POSTs)
+                # reuse it on every path, including errors and retries.
+                with self.session.request(method, url, **kwargs) as response:
+                    status = response.status_code
+                    if 200 <= status < 300:
+                        if orjson is not None:
+                            return orjson.loads(response.content)
+                        return response.json()
+                    if status == 429:
+                        delay = int(response.headers.get("Retry-After", 5))
+                        last_error = ("Rate limited by Shipp API", ())
+                        logger.warning(
+                            "Rate limited by Shipp API, waiting %d seconds", delay
+                        )
+                    elif 400 <= status < 500:
+                        raise RuntimeError(
+                            f"Shipp API client error {status}: {response.text[:200]}"
+                        )
+                    else:
+                        last_error = ("HTTP error %d", (status,))
+                        logger.warning("Attempt %d: HTTP error %d", attempt, status)
 
             except requests.exceptions.Timeout:
-                last_error = f"Request timed out after {DEFAULT_TIMEOUT}s"
-                logger.warning("Attempt %d: %s", attempt + 1, last_error)
+                last_error = ("Request timed out after %ss", (DEFAULT_TIMEOUT,))
+                logger.warning(
+                    "Attempt %d: Request timed out after %ss", attempt, DEFAULT_TIMEOUT
+                )
             except requests.exceptions.ConnectionError as e:
-                last_error = f"Connection error: {e}"
-                logger.warning("Attempt %d: %s", attempt + 1, last_error)
-            except requests.exceptions.HTTPError as e:
-                if e.response is not None and e.response.status_code < 500:
-                    raise
-                last_error = f"HTTP error: {e}"
-                logger.warning("Attempt %d: %s", attempt + 1, last_error)
-
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_BACKOFF * (attempt + 1))
-
-        raise RuntimeError(f"Shipp API request failed after {MAX_RETRIES + 1} attempts: {last_error}")
+                last_error = ("Connection error: %s", (e,))
+                logger.warning("Attempt %d: Connection error: %s", attempt, e)
+
+            if delay is None:
+                delay = random.uniform(
+                    0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2 ** (attempt - 1))
+                )
+            if time.monotonic() + delay >= deadline:
+                break
+            time.sleep(delay)
+
+        message, args = last_error
+        raise RuntimeError(
+            f"Shipp API request failed after {attempt} attempts: {message % args}"
+        )
 
     def get_schedule(self, sport: str, date: Optional[str] = None) -> dict:
         """
         Get the game schedule for a sport.
 
+        Responses are cached per (sport, date) for ``schedule_ttl`` seconds,
+        so repeat lookups within a poll cycle make no request.
+
         Args:
             sport: One of 'nba', 'mlb', 'soccer'
             date: Date string in YYYY-MM-DD format. Defaults to today.
@@ -94,18 +173,29 @@ class ShippClient:
         if date is None:
             date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-        return self._request("GET", f"/sports/{sport}/schedule", params={"date": date})
+        return self._cached(
+            self._schedule_cache, (sport, date), self.schedule_ttl,
+            lambda: self._request(
+                "GET", f"/sports/{sport}/schedule", params={"date": date}
+            ),
+        )
 
-    def get_todays_games(self, sport: str) -> list:
+    def get_todays_games(self, sport: str, date: Optional[str] = None) -> list:
         """
         Get today's games for a sport.
 
+        Args:
+            sport: One of 'nba', 'mlb', 'soccer'
+            date: Date string in YYYY-MM-DD format. Defaults to today.
+
         Returns:
             List of game dicts with keys: game_id, home_team, away_team,
             start_time, status.
         """
         try:
-            schedule = self.get_schedule(sport)
+            # A day's schedule is small, so it is decoded whole and cached by
+            # get_schedule rather than stream-parsed for just "games".
+            schedule = self.get_schedule(sport, date)
             return schedule.get("games", [])
         except Exception as e:
             logger.error("Failed to fetch %s schedule: %s", sport, e)
@@ -115,12 +205,22 @@ class ShippClient:
         """
         Get today's games for all supported sports.
 
+        The per-sport schedule requests are issued concurrently over the
+        shared session. Its pool keeps those connections alive between
+        polls, so the TLS handshakes are paid once per client rather than
+        once per tick. Today's date is resolved once, so every sport is
+        looked up (and cached) under the same day even across midnight.
+
         Returns:
             dict mapping sport name to list of games.
         """
+        date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        fetch = functools.partial(self.get_todays_games, date=date)
+        with ThreadPoolExecutor(max_workers=len(SUPPORTED_SPORTS)) as executor:
+            results = list(executor.map(fetch, SUPPORTED_SPORTS))
+
         all_games = {}
-        for sport in ["nba", "mlb", "soccer"]:
-            games = self.get_todays_games(sport)
+        for sport, games in zip(SUPPORTED_SPORTS, results):
             if games:
                 all_games[sport] = games
         return all_games
@@ -129,44 +229,83 @@ class ShippClient:
         """
         Get live scores for currently active games.
 
-        Creates a connection and polls for current state.
+        Creates a connection and polls for current state. Results are cached
+        per sport for ``live_scores_ttl`` seconds.
 
         Returns:
             List of live game dicts.
         """
         try:
-            filter_map = {
-                "nba": "Track all NBA games today with live scores and injury updates",
-                "mlb": "Track all MLB games today with live scores and roster transactions",
-                "soccer": "Track all soccer matches today with live scores and squad updates",
-            }
-            connection = self._request("POST", "/connections/create", json={
-                "filter_instructions": filter_map.get(sport, f"Track all {sport} games today with live scores"),
-            })
-            connection_id = connection.get("connection_id")
-            if not connection_id:
-                logger.error("No connection_id returned for %s", sport)
-                return []
-
-            result = self._request("POST", f"/connections/{connection_id}", json={"limit": 50})
-            return result.get("data", result.get("events", []))
-
+            return self._cached(
+                self._live_scores_cache, sport, self.live_scores_ttl,
+                lambda: self._fetch_live_scores(sport),
+            )
         except Exception as e:
             logger.error("Failed to get live scores for %s: %s", sport, e)
             return []
 
+    def _fetch_live_scores(self, sport: str) -> list:
+        """Create a live connection for sport and return its current events."""
+        connection = self._request("POST", "/connections/create", json={
+            "filter_instructions": _LIVE_FILTER_INSTRUCTIONS.get(
+                sport, f"Track all {sport} games today with live scores"
+            ),
+        })
+        connection_id = connection.get("connection_id")
+        if not connection_id:
+            logger.error("No connection_id returned for %s", sport)
+            return []
+
+        result = self._request("POST", f"/connections/{connection_id}", json={"limit": 50})
+        return result.get("data", result.get("events", []))
+
+    def get_all_live_scores(self, sports: Optional[list] = None) -> dict:
+        """
+        Get live scores for several sports at once.
+
+        Each sport's create/poll request chain runs sequentially, but the
+        chains for different sports run concurrently.
+
+        Args:
+            sports: Sports to fetch. Defaults to SUPPORTED_SPORTS.
+
+        Returns:
+            dict mapping sport name to its list of live game dicts.
+        """
+        if sports is None:
+            sports = SUPPORTED_SPORTS
+        with ThreadPoolExecutor(max_workers=len(sports) or 1) as executor:
+            results = list(executor.map(self.get_live_scores, sports))
+        return dict(zip(sports, results))
+
     def build_team_game_map(self) -> dict:
         """
         Build a mapping of team names to their game info for today.
 
+        Team names are keyed by ``str.casefold()``, which also folds
+        non-ASCII forms ("ß" -> "ss") that ``lower()`` leaves alone. When
+        the schedule is unchanged since the last call, the previous map is
+        returned as-is; treat it as read-only.
+
         Returns:
-            dict mapping lowercase team name -> game info dict.
+            dict mapping casefolded team name -> game info dict.
             Example: {"los angeles lakers": {"opponent": "Warriors", "time": "19:30", ...}}
         """
-        team_game_map = {}
         all_games = self.get_all_todays_games()
+        key = tuple(
+            (sport, tuple(
+                (g.get("game_id", ""), g.get("home_team", ""),
+                 g.get("away_team", ""), g.get("start_time", ""))
+                for g in games
+            ))
+            for sport, games in sorted(all_games.items())
+        )
+        if key == self._last_map_key:
+            return self._last_team_map
 
+        team_game_map = {}
         for sport, games in all_games.items():
+            sport = sys.intern(sport)
             for game in games:
                 home = game.get("home_team", "")
                 away = game.get("away_team", "")
@@ -174,7 +313,7 @@ class ShippClient:
                 game_id = game.get("game_id", "")
 
                 if home:
-                    team_game_map[home.lower()] = {
+                    team_game_map[home.casefold()] = {
                         "sport": sport,
                         "opponent": away,
                         "time": start_time,
@@ -182,7 +321,7 @@ class ShippClient:
                         "home": True,
                     }
                 if away:
-                    team_game_map[away.lower()] = {
+                    team_game_map[away.casefold()] = {
                         "sport": sport,
                         "opponent": home,
                         "time": start_time,
@@ -190,4 +329,6 @@ class ShippClient:
                         "home": False,
                     }
 
+        self._last_map_key = key
+        self._last_team_map = team_game_map
         return team_game_map
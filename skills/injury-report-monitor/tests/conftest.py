@@ -0,0 +1,26 @@
+"""Shared pytest configuration for the Injury Report Monitor tests."""
+
+import os
+
+import pytest
+
+
+def pytest_configure(config):
+    # ShippClient.__init__ raises ValueError when no API key is set, so give
+    # every process (including each xdist worker) a key before the tests
+    # import the monitor. Tests control client behaviour per-test via mocks.
+    os.environ.setdefault("SHIPP_API_KEY", "test-key-for-unit-tests")
+
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """
+    Skip the politeness wait before each fetch.
+
+    Only the module-level ``_rate_limit`` that ``_fetch_html`` calls is
+    replaced; ``time.sleep`` itself is untouched. TestRateLimit imports the
+    real function directly, so it still asserts the waits with its own
+    sleep patch.
+    """
+    monkeypatch.setattr("scripts.injury_sources._rate_limit", lambda url: None)
@@ -7,24 +7,29 @@ error handling, and edge cases.
 """
 
 import json
-import os
-import tempfile
+import threading
+import time
+import types
 from datetime import datetime, timezone
 from unittest import mock
 from unittest.mock import MagicMock, patch, PropertyMock
 
 import pytest
 import requests
-
-# We need to patch the ShippClient before importing InjuryMonitor,
-# because ShippClient.__init__ raises ValueError when no API key is set.
-# We set the env var for imports, then control behaviour per-test via mocks.
-os.environ.setdefault("SHIPP_API_KEY", "test-key-for-unit-tests")
+from bs4 import BeautifulSoup
 
 from scripts.injury_sources import (
     _normalize_status,
     _make_injury_record,
     _fetch_html,
+    _rate_limit,
+    _SESSION,
+    _DOMAIN_LAST_FETCH,
+    _HTTP_CACHE,
+    _PARSED_CACHE,
+    HTML_PARSER,
+    POLITE_DELAY,
+    MAX_CONCURRENT_REQUESTS,
     parse_espn_injuries,
     parse_cbs_injuries,
     parse_nba_injury_report,
@@ -40,68 +45,161 @@ from scripts.shipp_wrapper import ShippClient
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _html_page(body_html: str) -> str:
-    """Wrap a body fragment in a minimal HTML document."""
-    return f"<html><body>{body_html}</body></html>"
-
-
-def _mock_response(text="", status_code=200, json_data=None):
-    """Create a mock requests.Response."""
-    resp = MagicMock(spec=requests.Response)
-    resp.status_code = status_code
-    resp.text = text
-    resp.raise_for_status = MagicMock()
-    if status_code >= 400:
-        resp.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            response=resp
-        )
-    if json_data is not None:
-        resp.json.return_value = json_data
-    return resp
+_PAGE_HEAD = b"<html><body>"
+_PAGE_TAIL = b"</body></html>"
+
+
+def _html_soup(body_html: str) -> BeautifulSoup:
+    """Parse a body fragment wrapped in a minimal HTML document."""
+    return BeautifulSoup(
+        _PAGE_HEAD + body_html.encode("utf-8") + _PAGE_TAIL,
+        HTML_PARSER, from_encoding="utf-8",
+    )
+
+
+# Parsers only read the soup (and _PARSED_CACHE is reset per test), so these
+# trees are built once per module and shared read-only.
+
+@pytest.fixture(scope="module")
+def cbs_warriors_soup():
+    return _html_soup("""
+    <h4>Golden State Warriors</h4>
+    <table>
+        <tr><td>Curry</td><td>PG</td><td>Feb 17</td><td>Knee</td><td>Questionable</td></tr>
+    </table>
+    """)
+
+
+@pytest.fixture(scope="module")
+def soccer_arsenal_soup():
+    return _html_soup("""
+    <h2>Arsenal</h2>
+    <table>
+        <tr><td>Bukayo Saka</td><td>Injured</td><td>Hamstring</td><td>Mar 2026</td></tr>
+    </table>
+    """)
+
+
+@pytest.fixture(scope="module")
+def bulk_injury_list():
+    """25 plain 'out' injuries with no game today and no status change."""
+    return [
+        {"player": f"Player {i}", "team": f"Team {i}", "status": "out",
+         "status_changed": False, "game_today": None, "injury": "Knee"}
+        for i in range(25)
+    ]
+
+
+@pytest.fixture
+def bare_monitor():
+    """An InjuryMonitor built without __init__: no client, no state file, empty caches."""
+    monitor = InjuryMonitor.__new__(InjuryMonitor)
+    monitor.shipp = None
+    monitor.state_path = None
+    monitor._team_game_map = None
+    monitor._nickname_index = None
+    monitor._todays_games_cache = {}
+    monitor._report_cache = {}
+    monitor._cache_date = None
+    return monitor
+
+
+@pytest.fixture(autouse=True)
+def _reset_fetch_state():
+    """Keep politeness slots and cached pages from leaking between tests."""
+    _DOMAIN_LAST_FETCH.clear()
+    _HTTP_CACHE.clear()
+    _PARSED_CACHE.clear()
+    yield
+    _DOMAIN_LAST_FETCH.clear()
+    _HTTP_CACHE.clear()
+    _PARSED_CACHE.clear()
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response; far cheaper than a spec'd MagicMock."""
+
+    __slots__ = ("status_code", "text", "content", "headers", "encoding", "closed")
+
+    def __init__(self, text="", status_code=200, json_data=None, headers=None):
+        if json_data is not None:
+            text = json.dumps(json_data)
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.encoding = None
+        self.closed = False
+
+    def json(self):
+        try:
+            return json.loads(self.content)
+        except json.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 # ---------------------------------------------------------------------------
 # 1. Status Normalization
 # ---------------------------------------------------------------------------
 
-class TestNormalizeStatus:
-    """Tests for _normalize_status mapping."""
-
-    def test_standard_statuses(self):
-        assert _normalize_status("Out") == "out"
-        assert _normalize_status("Doubtful") == "doubtful"
-        assert _normalize_status("Questionable") == "questionable"
-        assert _normalize_status("Probable") == "probable"
-
-    def test_abbreviations(self):
-        assert _normalize_status("O") == "out"
-        assert _normalize_status("D") == "doubtful"
-        assert _normalize_status("Q") == "questionable"
-        assert _normalize_status("P") == "probable"
+# Raw status -> expected normalized status
+_STATUS_CASES = {
+    # Standard statuses
+    "Out": "out",
+    "Doubtful": "doubtful",
+    "Questionable": "questionable",
+    "Probable": "probable",
+    # Abbreviations
+    "O": "out",
+    "D": "doubtful",
+    "Q": "questionable",
+    "P": "probable",
+    # Day-to-day variants
+    "Day-to-Day": "day-to-day",
+    "DTD": "day-to-day",
+    "day to day": "day-to-day",
+    # Injured list variants
+    "10-Day IL": "il-10",
+    "15-Day IL": "il-15",
+    "60-Day IL": "il-60",
+    "IL": "il-15",
+    "Injured List": "il-15",
+    "10-day injured list": "il-10",
+    "15-day injured list": "il-15",
+    "60-day injured list": "il-60",
+    # Suspended variants
+    "Suspended": "suspended",
+    "SUSP": "suspended",
+    # Unknown falls through
+    "something weird": "unknown",
+    "": "unknown",
+    "   ": "unknown",
+}
 
-    def test_day_to_day_variants(self):
-        assert _normalize_status("Day-to-Day") == "day-to-day"
-        assert _normalize_status("DTD") == "day-to-day"
-        assert _normalize_status("day to day") == "day-to-day"
 
-    def test_injured_list_variants(self):
-        assert _normalize_status("10-Day IL") == "il-10"
-        assert _normalize_status("15-Day IL") == "il-15"
-        assert _normalize_status("60-Day IL") == "il-60"
-        assert _normalize_status("IL") == "il-15"
-        assert _normalize_status("Injured List") == "il-15"
-        assert _normalize_status("10-day injured list") == "il-10"
-        assert _normalize_status("15-day injured list") == "il-15"
-        assert _normalize_status("60-day injured list") == "il-60"
-
-    def test_suspended_variants(self):
-        assert _normalize_status("Suspended") == "suspended"
-        assert _normalize_status("SUSP") == "suspended"
+class TestNormalizeStatus:
+    """Tests for _normalize_status mapping."""
 
-    def test_unknown_falls_through(self):
-        assert _normalize_status("something weird") == "unknown"
-        assert _normalize_status("") == "unknown"
-        assert _normalize_status("   ") == "unknown"
+    def test_status_table(self):
+        mismatches = {
+            raw: (expected, _normalize_status(raw))
+            for raw, expected in _STATUS_CASES.items()
+            if _normalize_status(raw) != expected
+        }
+        assert not mismatches, mismatches
 
 
 # ---------------------------------------------------------------------------
@@ -144,6 +242,15 @@ class TestMakeInjuryRecord:
         assert rec["raw_status"] == "Q"
         assert rec["injury"] == "Knee"
 
+    def test_repeated_fields_are_interned(self):
+        first, second = (
+            _make_injury_record("Player", "".join(["Golden State ", "Warriors"]),
+                                "Out", "Knee", "".join(["es", "pn"]), "nba")
+            for _ in range(2)
+        )
+        for field in ("team", "status", "source"):
+            assert first[field] is second[field]
+
     def test_empty_injury_defaults_to_undisclosed(self):
         rec = _make_injury_record(
             player="Player X",
@@ -178,6 +285,19 @@ class TestMakeInjuryRecord:
         )
         assert rec["updated"] == "2026-02-18T12:00:00Z"
 
+    def test_shared_fetched_at_fills_missing_updated(self):
+        rec = _make_injury_record(
+            player="Player X",
+            team="Team Y",
+            status="Out",
+            injury="Knee",
+            source="espn",
+            sport="nba",
+            fetched_at="2026-02-18T12:00:00+00:00",
+        )
+        assert rec["fetched_at"] == "2026-02-18T12:00:00+00:00"
+        assert rec["updated"] == "2026-02-18T12:00:00+00:00"
+
 
 # ---------------------------------------------------------------------------
 # 3. HTML Fetching
@@ -186,68 +306,200 @@ class TestMakeInjuryRecord:
 class TestFetchHtml:
     """Tests for the _fetch_html helper."""
 
-    @patch("scripts.injury_sources.requests.get")
+    @patch("scripts.injury_sources._SESSION.get")
     def test_successful_fetch(self, mock_get):
-        mock_get.return_value = _mock_response(text="<html><body>hi</body></html>")
+        mock_get.return_value = _FakeResponse(text="<html><body>hi</body></html>")
         soup = _fetch_html("https://example.com")
         assert soup is not None
         assert soup.body.text == "hi"
 
-    @patch("scripts.injury_sources.requests.get")
+    @patch("scripts.injury_sources._SESSION.get")
     def test_returns_none_on_persistent_failure(self, mock_get):
         mock_get.side_effect = requests.exceptions.ConnectionError("fail")
-        soup = _fetch_html("https://example.com", retry=False)
+        soup = _fetch_html("https://example.com")
         assert soup is None
 
-    @patch("scripts.injury_sources.requests.get")
-    @patch("scripts.injury_sources.time.sleep")
-    def test_retries_once_on_failure(self, mock_sleep, mock_get):
-        # First call fails, second succeeds
-        mock_get.side_effect = [
-            requests.exceptions.Timeout("timeout"),
-            _mock_response(text="<html><body>ok</body></html>"),
-        ]
-        soup = _fetch_html("https://example.com", retry=True)
-        assert soup is not None
-        assert mock_get.call_count == 2
-        mock_sleep.assert_called_once_with(5)
+    @patch("scripts.injury_sources._SESSION.get")
+    def test_browser_headers_come_from_session(self, mock_get):
+        mock_get.return_value = _FakeResponse(text="<html><body>hi</body></html>")
+        _fetch_html("https://example.com")
+        assert mock_get.call_args.kwargs["headers"] is None
+        assert _SESSION.headers["User-Agent"].startswith("Mozilla/5.0")
+
+    @patch("scripts.injury_sources._SESSION.get")
+    def test_decodes_with_header_charset(self, mock_get):
+        resp = _FakeResponse(headers={"Content-Type": "text/html; charset=ISO-8859-1"})
+        resp.content = "<html><body>Ligue Élite</body></html>".encode("latin-1")
+        mock_get.return_value = resp
+        soup = _fetch_html("https://example.com")
+        assert soup.body.text == "Ligue Élite"
+
+    @patch("scripts.injury_sources._SESSION.get")
+    def test_requests_in_flight_are_capped(self, mock_get):
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+
+        def _get(url, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return _FakeResponse(text="<html><body>hi</body></html>")
+
+        mock_get.side_effect = _get
+        urls = [f"https://host{i}.example.com" for i in range(3 * MAX_CONCURRENT_REQUESTS)]
+        threads = [threading.Thread(target=_fetch_html, args=(u,)) for u in urls]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert mock_get.call_count == len(urls)
+        assert in_flight[1] <= MAX_CONCURRENT_REQUESTS
+
+    @patch("scripts.injury_sources._SESSION.get")
+    def test_undeclared_charset_decodes_as_utf8(self, mock_get):
+        resp = _FakeResponse(headers={"Content-Type": "text/html"})
+        resp.content = "<html><body>Atlético Madrid</body></html>".encode("utf-8")
+        mock_get.return_value = resp
+        soup = _fetch_html("https://example.com")
+        assert soup.body.text == "Atlético Madrid"
 
-    @patch("scripts.injury_sources.requests.get")
+    def test_session_retries_transient_failures_once(self):
+        adapter = _SESSION.get_adapter("https://www.espn.com/nba/injuries")
+        retries = adapter.max_retries
+        assert retries.total == 1
+        assert set(retries.status_forcelist) == {502, 503, 504}
+
+    @patch("scripts.injury_sources._SESSION.get")
     def test_returns_none_when_http_error(self, mock_get):
-        mock_get.return_value = _mock_response(text="", status_code=500)
-        soup = _fetch_html("https://example.com", retry=False)
+        mock_get.return_value = _FakeResponse(text="", status_code=500)
+        soup = _fetch_html("https://example.com")
         assert soup is None
 
+    @patch("scripts.injury_sources._SESSION.get")
+    def test_fresh_page_served_from_cache(self, mock_get):
+        mock_get.return_value = _FakeResponse(text="<html><body>hi</body></html>")
+        first = _fetch_html("https://example.com")
+        second = _fetch_html("https://example.com")
+        assert second is first
+        assert mock_get.call_count == 1
+
+    @patch("scripts.injury_sources._SESSION.get")
+    def test_stale_page_revalidated_with_etag(self, mock_get):
+        mock_get.side_effect = [
+            _FakeResponse(
+                text="<html><body>hi</body></html>",
+                headers={"ETag": '"v1"', "Last-Modified": "Wed, 14 Oct 2026 12:00:00 GMT"},
+            ),
+            _FakeResponse(text="", status_code=304),
+        ]
+        first = _fetch_html("https://example.com")
+        second = _fetch_html("https://example.com", max_age=0)
+        assert second is first
+        sent = mock_get.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Wed, 14 Oct 2026 12:00:00 GMT"
+
+    @patch("scripts.injury_sources._SESSION.get")
+    def test_bare_304_keeps_cached_validators(self, mock_get):
+        mock_get.side_effect = [
+            _FakeResponse(
+                text="<html><body>hi</body></html>",
+                headers={"ETag": '"v1"', "Last-Modified": "Wed, 14 Oct 2026 12:00:00 GMT"},
+            ),
+            _FakeResponse(text="", status_code=304),
+            _FakeResponse(text="", status_code=304),
+        ]
+        first = _fetch_html("https://example.com")
+        _fetch_html("https://example.com", max_age=0)
+        third = _fetch_html("https://example.com", max_age=0)
+        assert third is first
+        sent = mock_get.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Wed, 14 Oct 2026 12:00:00 GMT"
+
+
+class TestRateLimit:
+    """Tests for the per-host politeness gate."""
+
+    @patch("scripts.injury_sources.time.sleep")
+    @patch("scripts.injury_sources.time.monotonic", return_value=100.0)
+    def test_first_request_to_host_does_not_wait(self, mock_clock, mock_sleep):
+        _rate_limit("https://www.espn.com/nba/injuries")
+        mock_sleep.assert_not_called()
+
+    @patch("scripts.injury_sources.time.sleep")
+    @patch("scripts.injury_sources.time.monotonic", return_value=100.0)
+    def test_same_host_is_spaced(self, mock_clock, mock_sleep):
+        _rate_limit("https://www.espn.com/nba/injuries")
+        _rate_limit("https://www.espn.com/soccer/injuries")
+        _rate_limit("https://www.espn.com/mlb/injuries")
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [
+            POLITE_DELAY, 2 * POLITE_DELAY,
+        ]
+
+    @patch("scripts.injury_sources.time.sleep")
+    @patch("scripts.injury_sources.time.monotonic", return_value=100.0)
+    def test_different_hosts_do_not_wait(self, mock_clock, mock_sleep):
+        _rate_limit("https://www.espn.com/nba/injuries")
+        _rate_limit("https://www.cbssports.com/nba/injuries/")
+        _rate_limit("https://statsapi.mlb.com/api/v1/transactions")
+        mock_sleep.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # 4. ESPN Parsing
 # ---------------------------------------------------------------------------
 
+# ESPN page layouts -> expected (player, team, status) rows
+_ESPN_LAYOUTS = [
+    ("""
+    <div class="ResponsiveTable">
+        <h2>Los Angeles Lakers</h2>
+        <table>
+            <tr><td>LeBron James</td><td>Out</td><td>Ankle</td><td>Feb 18</td></tr>
+            <tr><td>Anthony Davis</td><td>Questionable</td><td>Knee</td></tr>
+        </table>
+    </div>
+    """, [
+        ("LeBron James", "Los Angeles Lakers", "out"),
+        ("Anthony Davis", "Los Angeles Lakers", "questionable"),
+    ]),
+    ("""
+    <div class="ResponsiveTable">
+        <h2>Team</h2>
+        <table>
+            <tr><td>Name</td><td>Status</td><td>Injury</td></tr>
+            <tr><td>Player A</td><td>Out</td><td>Knee</td></tr>
+        </table>
+    </div>
+    """, [("Player A", "Team", "out")]),
+    # No ResponsiveTable divs: falls back to flat tables
+    ("""
+    <h3>Boston Celtics</h3>
+    <table>
+        <tr><td>Jaylen Brown</td><td>DTD</td><td>Hamstring</td></tr>
+    </table>
+    """, [("Jaylen Brown", "Boston Celtics", "day-to-day")]),
+]
+
+
 class TestParseEspnInjuries:
     """Tests for parse_espn_injuries with mocked HTML."""
 
+    @pytest.mark.parametrize(
+        "body,expected", _ESPN_LAYOUTS,
+        ids=["responsive", "skip_header", "fallback_flat"],
+    )
     @patch("scripts.injury_sources._fetch_html")
-    def test_parses_table_structure(self, mock_fetch):
-        html = _html_page("""
-        <div class="ResponsiveTable">
-            <h2>Los Angeles Lakers</h2>
-            <table>
-                <tr><td>LeBron James</td><td>Out</td><td>Ankle</td><td>Feb 18</td></tr>
-                <tr><td>Anthony Davis</td><td>Questionable</td><td>Knee</td></tr>
-            </table>
-        </div>
-        """)
-        from bs4 import BeautifulSoup
-        mock_fetch.return_value = BeautifulSoup(html, "html.parser")
+    def test_layouts(self, mock_fetch, body, expected):
+        mock_fetch.return_value = _html_soup(body)
 
         injuries = parse_espn_injuries("nba")
-        assert len(injuries) == 2
-        assert injuries[0]["player"] == "LeBron James"
-        assert injuries[0]["status"] == "out"
-        assert injuries[0]["team"] == "Los Angeles Lakers"
-        assert injuries[0]["source"] == "espn"
-        assert injuries[1]["player"] == "Anthony Davis"
-        assert injuries[1]["status"] == "questionable"
+        assert [(i["player"], i["team"], i["status"]) for i in injuries] == expected
+        assert {i["source"] for i in injuries} == {"espn"}
 
     @patch("scripts.injury_sources._fetch_html")
     def test_returns_empty_on_none_soup(self, mock_fetch):
@@ -259,41 +511,34 @@ class TestParseEspnInjuries:
         injuries = parse_espn_injuries("cricket")
         assert injuries == []
 
-    @patch("scripts.injury_sources._fetch_html")
-    def test_skips_header_rows(self, mock_fetch):
-        html = _html_page("""
+    @patch("scripts.injury_sources._SESSION.get")
+    def test_revalidated_page_refreshes_defaulted_timestamps(self, mock_get):
+        resp = _FakeResponse(headers={"ETag": '"v1"'})
+        resp.content = b"""
         <div class="ResponsiveTable">
-            <h2>Team</h2>
+            <h2>Los Angeles Lakers</h2>
             <table>
-                <tr><td>Name</td><td>Status</td><td>Injury</td></tr>
-                <tr><td>Player A</td><td>Out</td><td>Knee</td></tr>
+                <tr><td>LeBron James</td><td>Out</td><td>Ankle</td><td>Feb 18</td></tr>
+                <tr><td>Anthony Davis</td><td>Questionable</td><td>Knee</td></tr>
             </table>
         </div>
-        """)
-        from bs4 import BeautifulSoup
-        mock_fetch.return_value = BeautifulSoup(html, "html.parser")
-
-        injuries = parse_espn_injuries("nba")
-        assert len(injuries) == 1
-        assert injuries[0]["player"] == "Player A"
+        """
+        mock_get.side_effect = [resp, _FakeResponse(text="", status_code=304)]
+        first = parse_espn_injuries("nba")
+        # Age the cached page so the next fetch revalidates and gets the 304
+        url = mock_get.call_args.args[0]
+        _HTTP_CACHE[url] = (float("-inf"),) + _HTTP_CACHE[url][1:]
+        with patch("scripts.injury_sources.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime(2099, 1, 1, tzinfo=timezone.utc)
+            second = parse_espn_injuries("nba")
 
-    @patch("scripts.injury_sources._fetch_html")
-    def test_fallback_flat_table_parsing(self, mock_fetch):
-        """When no ResponsiveTable divs are found, falls back to flat tables."""
-        html = _html_page("""
-        <h3>Boston Celtics</h3>
-        <table>
-            <tr><td>Jaylen Brown</td><td>DTD</td><td>Hamstring</td></tr>
-        </table>
-        """)
-        from bs4 import BeautifulSoup
-        mock_fetch.return_value = BeautifulSoup(html, "html.parser")
-
-        injuries = parse_espn_injuries("nba")
-        assert len(injuries) == 1
-        assert injuries[0]["player"] == "Jaylen Brown"
-        assert injuries[0]["status"] == "day-to-day"
-        assert injuries[0]["team"] == "Boston Celtics"
+        assert mock_get.call_count == 2
+        refetched = "2099-01-01T00:00:00+00:00"
+        assert first[1]["updated"] == first[1]["fetched_at"] != refetched
+        assert [(i["fetched_at"], i["updated"]) for i in second] == [
+            (refetched, "Feb 18"),
+            (refetched, refetched),
+        ]
 
 
 # ---------------------------------------------------------------------------
@@ -303,17 +548,9 @@ class TestParseEspnInjuries:
 class TestParseCbsInjuries:
     """Tests for parse_cbs_injuries."""
 
-    @patch("scripts.injury_sources.time.sleep")
     @patch("scripts.injury_sources._fetch_html")
-    def test_parses_5_column_layout(self, mock_fetch, mock_sleep):
-        html = _html_page("""
-        <h4>Golden State Warriors</h4>
-        <table>
-            <tr><td>Curry</td><td>PG</td><td>Feb 17</td><td>Knee</td><td>Questionable</td></tr>
-        </table>
-        """)
-        from bs4 import BeautifulSoup
-        mock_fetch.return_value = BeautifulSoup(html, "html.parser")
+    def test_parses_5_column_layout(self, mock_fetch, cbs_warriors_soup):
+        mock_fetch.return_value = cbs_warriors_soup
 
         injuries = parse_cbs_injuries("nba")
         assert len(injuries) == 1
@@ -322,13 +559,58 @@ class TestParseCbsInjuries:
         assert injuries[0]["injury"] == "Knee"
         assert injuries[0]["source"] == "cbs"
 
+    @patch("scripts.injury_sources._fetch_html")
+    def test_team_taken_from_nearest_preceding_header(self, mock_fetch):
+        soup = _html_soup("""
+        <h4>Golden State Warriors</h4>
+        <h3>Pacific Division</h3>
+        <table>
+            <tr><td>Curry</td><td>PG</td><td>Feb 17</td><td>Knee</td><td>Questionable</td></tr>
+        </table>
+        <h4>Los Angeles Lakers</h4>
+        <table>
+            <tr><td>James</td><td>SF</td><td>Feb 17</td><td>Ankle</td><td>Out</td></tr>
+        </table>
+        """)
+        mock_fetch.return_value = soup
+
+        injuries = parse_cbs_injuries("nba")
+        # <h4> headers take precedence over a closer <h3>
+        assert [(i["player"], i["team"]) for i in injuries] == [
+            ("Curry", "Golden State Warriors"),
+            ("James", "Los Angeles Lakers"),
+        ]
+
+    @patch("scripts.injury_sources._fetch_html")
+    def test_unchanged_page_reuses_parsed_records(self, mock_fetch):
+        soup = _html_soup("""
+        <h4>Golden State Warriors</h4>
+        <table>
+            <tr><td>Curry</td><td>PG</td><td>Feb 17</td><td>Knee</td><td>Questionable</td></tr>
+        </table>
+        """)
+        mock_fetch.return_value = soup
+
+        first = parse_cbs_injuries("nba")
+        # Same soup object == page served from cache; the tree is not re-read
+        soup.table.decompose()
+        first[0]["_key"] = "mutated downstream"
+        second = parse_cbs_injuries("nba")
+
+        assert [i["player"] for i in second] == ["Curry"]
+        assert "_key" not in second[0]
+        assert second[0] is not first[0]
+
+        # A different soup (page changed) is parsed again
+        mock_fetch.return_value = _html_soup("")
+        assert parse_cbs_injuries("nba") == []
+
     def test_returns_empty_for_unsupported_sport(self):
         injuries = parse_cbs_injuries("soccer")
         assert injuries == []
 
-    @patch("scripts.injury_sources.time.sleep")
     @patch("scripts.injury_sources._fetch_html")
-    def test_returns_empty_on_none_soup(self, mock_fetch, mock_sleep):
+    def test_returns_empty_on_none_soup(self, mock_fetch):
         mock_fetch.return_value = None
         injuries = parse_cbs_injuries("nba")
         assert injuries == []
@@ -338,23 +620,80 @@ class TestParseCbsInjuries:
 # 6. MLB Transaction Parsing
 # ---------------------------------------------------------------------------
 
+# Transaction payloads shared read-only by the MLB tests
+_MLB_IL_PLACEMENT = {
+    "transactions": [
+        {
+            "description": "Los Angeles Dodgers placed LHP Clayton Kershaw on the 15-Day IL with left elbow inflammation.",
+            "typeDesc": "Placed on 15-Day IL",
+            "player": {"fullName": "Clayton Kershaw"},
+            "team": {"name": "Los Angeles Dodgers"},
+            "effectiveDate": "2026-02-18",
+        }
+    ]
+}
+
+_MLB_ACTIVATION = {
+    "transactions": [
+        {
+            "description": "Activated from 10-Day IL",
+            "typeDesc": "Activated from 10-Day IL",
+            "player": {"fullName": "Mike Trout"},
+            "team": {"name": "Los Angeles Angels"},
+            "effectiveDate": "2026-02-18",
+        }
+    ]
+}
+
+_MLB_TRADE = {
+    "transactions": [
+        {
+            "description": "Traded to the Yankees",
+            "typeDesc": "Trade",
+            "player": {"fullName": "Some Player"},
+            "team": {"name": "New York Yankees"},
+            "effectiveDate": "2026-02-18",
+        }
+    ]
+}
+
+_MLB_WITH_CLAUSE = {
+    "transactions": [
+        {
+            "description": "Team placed Player on 15-Day IL with right shoulder inflammation.",
+            "typeDesc": "Placed on 15-Day IL",
+            "player": {"fullName": "Player X"},
+            "team": {"name": "Team A"},
+            "effectiveDate": "2026-02-18",
+        }
+    ]
+}
+
+_MLB_DUE_TO_CLAUSE = {
+    "transactions": [
+        {
+            "description": "Team placed Player without delay on 10-Day IL due to left hamstring strain.",
+            "typeDesc": "Placed on 10-Day IL",
+            "player": {"fullName": "Player Y"},
+            "team": {"name": "Team B"},
+            "effectiveDate": "2026-02-18",
+        }
+    ]
+}
+
+
 class TestParseMlbTransactions:
     """Tests for parse_mlb_transactions."""
 
-    @patch("scripts.injury_sources.time.sleep")
-    @patch("scripts.injury_sources.requests.get")
-    def test_parses_il_placement(self, mock_get, mock_sleep):
-        mock_get.return_value = _mock_response(json_data={
-            "transactions": [
-                {
-                    "description": "Los Angeles Dodgers placed LHP Clayton Kershaw on the 15-Day IL with left elbow inflammation.",
-                    "typeDesc": "Placed on 15-Day IL",
-                    "player": {"fullName": "Clayton Kershaw"},
-                    "team": {"name": "Los Angeles Dodgers"},
-                    "effectiveDate": "2026-02-18",
-                }
-            ]
-        })
+    @pytest.fixture
+    def mock_get(self, monkeypatch):
+        """Stub the shared session's GET for each test."""
+        get = MagicMock()
+        monkeypatch.setattr(_SESSION, "get", get)
+        return get
+
+    def test_parses_il_placement(self, mock_get):
+        mock_get.return_value = _FakeResponse(json_data=_MLB_IL_PLACEMENT)
 
         injuries = parse_mlb_transactions()
         assert len(injuries) == 1
@@ -363,69 +702,43 @@ class TestParseMlbTransactions:
         assert injuries[0]["team"] == "Los Angeles Dodgers"
         assert injuries[0]["source"] == "mlb_transactions"
 
-    @patch("scripts.injury_sources.time.sleep")
-    @patch("scripts.injury_sources.requests.get")
-    def test_parses_activation(self, mock_get, mock_sleep):
-        mock_get.return_value = _mock_response(json_data={
-            "transactions": [
-                {
-                    "description": "Activated from 10-Day IL",
-                    "typeDesc": "Activated from 10-Day IL",
-                    "player": {"fullName": "Mike Trout"},
-                    "team": {"name": "Los Angeles Angels"},
-                    "effectiveDate": "2026-02-18",
-                }
-            ]
-        })
+    def test_parses_activation(self, mock_get):
+        mock_get.return_value = _FakeResponse(json_data=_MLB_ACTIVATION)
 
         injuries = parse_mlb_transactions()
         assert len(injuries) == 1
         assert injuries[0]["status"] == "active"
 
-    @patch("scripts.injury_sources.time.sleep")
-    @patch("scripts.injury_sources.requests.get")
-    def test_skips_non_il_transactions(self, mock_get, mock_sleep):
-        mock_get.return_value = _mock_response(json_data={
-            "transactions": [
-                {
-                    "description": "Traded to the Yankees",
-                    "typeDesc": "Trade",
-                    "player": {"fullName": "Some Player"},
-                    "team": {"name": "New York Yankees"},
-                    "effectiveDate": "2026-02-18",
-                }
-            ]
-        })
+    def test_skips_non_il_transactions(self, mock_get):
+        mock_get.return_value = _FakeResponse(json_data=_MLB_TRADE)
 
         injuries = parse_mlb_transactions()
         assert len(injuries) == 0
 
-    @patch("scripts.injury_sources.time.sleep")
-    @patch("scripts.injury_sources.requests.get")
-    def test_handles_request_failure(self, mock_get, mock_sleep):
+    def test_handles_request_failure(self, mock_get):
         mock_get.side_effect = requests.exceptions.ConnectionError("fail")
         injuries = parse_mlb_transactions()
         assert injuries == []
 
-    @patch("scripts.injury_sources.time.sleep")
-    @patch("scripts.injury_sources.requests.get")
-    def test_extracts_injury_description_from_with_clause(self, mock_get, mock_sleep):
-        mock_get.return_value = _mock_response(json_data={
-            "transactions": [
-                {
-                    "description": "Team placed Player on 15-Day IL with right shoulder inflammation.",
-                    "typeDesc": "Placed on 15-Day IL",
-                    "player": {"fullName": "Player X"},
-                    "team": {"name": "Team A"},
-                    "effectiveDate": "2026-02-18",
-                }
-            ]
-        })
+    def test_handles_malformed_json(self, mock_get):
+        mock_get.return_value = _FakeResponse(text="<html>maintenance</html>")
+        assert parse_mlb_transactions() == []
+
+    def test_extracts_injury_description_from_with_clause(self, mock_get):
+        mock_get.return_value = _FakeResponse(json_data=_MLB_WITH_CLAUSE)
 
         injuries = parse_mlb_transactions()
         assert len(injuries) == 1
         assert injuries[0]["injury"] == "right shoulder inflammation"
 
+    def test_extracts_injury_description_from_due_to_clause(self, mock_get):
+        mock_get.return_value = _FakeResponse(json_data=_MLB_DUE_TO_CLAUSE)
+
+        injuries = parse_mlb_transactions()
+        assert len(injuries) == 1
+        # "without" is not the "with" marker
+        assert injuries[0]["injury"] == "left hamstring strain"
+
 
 # ---------------------------------------------------------------------------
 # 7. Soccer Parsing
@@ -434,17 +747,9 @@ class TestParseMlbTransactions:
 class TestParseSoccerInjuries:
     """Tests for parse_soccer_injuries."""
 
-    @patch("scripts.injury_sources.time.sleep")
     @patch("scripts.injury_sources._fetch_html")
-    def test_parses_premier_league_injuries(self, mock_fetch, mock_sleep):
-        html = _html_page("""
-        <h2>Arsenal</h2>
-        <table>
-            <tr><td>Bukayo Saka</td><td>Injured</td><td>Hamstring</td><td>Mar 2026</td></tr>
-        </table>
-        """)
-        from bs4 import BeautifulSoup
-        mock_fetch.return_value = BeautifulSoup(html, "html.parser")
+    def test_parses_premier_league_injuries(self, mock_fetch, soccer_arsenal_soup):
+        mock_fetch.return_value = soccer_arsenal_soup
 
         injuries = parse_soccer_injuries("premier-league")
         assert len(injuries) == 1
@@ -454,9 +759,8 @@ class TestParseSoccerInjuries:
         assert injuries[0]["sport"] == "soccer"
         assert injuries[0].get("expected_return") == "Mar 2026"
 
-    @patch("scripts.injury_sources.time.sleep")
     @patch("scripts.injury_sources._fetch_html")
-    def test_unknown_league_falls_back(self, mock_fetch, mock_sleep):
+    def test_unknown_league_falls_back(self, mock_fetch):
         """Unknown league should still attempt a fetch using the fallback URL."""
         mock_fetch.return_value = None
         injuries = parse_soccer_injuries("bundesliga")
@@ -464,6 +768,13 @@ class TestParseSoccerInjuries:
         # Verify it was called (fallback URL used)
         mock_fetch.assert_called_once()
 
+    @patch("scripts.injury_sources._fetch_html")
+    def test_leagues_sharing_fallback_url_parse_separately(self, mock_fetch, soccer_arsenal_soup):
+        mock_fetch.return_value = soccer_arsenal_soup
+        parse_soccer_injuries("bundesliga")
+        injuries = parse_soccer_injuries("serie-a")
+        assert [i["league"] for i in injuries] == ["serie-a"]
+
 
 # ---------------------------------------------------------------------------
 # 8. fetch_all_injuries Aggregation
@@ -505,6 +816,49 @@ class TestFetchAllInjuries:
         # ESPN marked as ok
         assert result["sources"]["espn_nba"]["status"] == "ok"
 
+    @patch("scripts.injury_sources.parse_espn_injuries")
+    @patch("scripts.injury_sources.parse_cbs_injuries")
+    @patch("scripts.injury_sources.parse_nba_injury_report")
+    def test_sources_fetched_concurrently(self, mock_nba, mock_cbs, mock_espn):
+        """All NBA sources must be in flight at once; sequential calls would
+        break the barrier and be reported as errors."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _source(name):
+            def _fetch(*args):
+                barrier.wait()
+                return [_make_injury_record(name, "Team", "Out", "Knee", name, "nba")]
+            return _fetch
+
+        mock_espn.side_effect = _source("espn")
+        mock_cbs.side_effect = _source("cbs")
+        mock_nba.side_effect = _source("nba_official")
+
+        result = fetch_all_injuries(sports=["nba"])
+        assert all(s["status"] == "ok" for s in result["sources"].values())
+        # Records are merged in source order, not completion order
+        players = [inj["player"] for inj in result["injuries"]["nba"]]
+        assert players == ["espn", "cbs", "nba_official"]
+
+    @patch("scripts.injury_sources.parse_soccer_injuries")
+    def test_soccer_leagues_fetched_concurrently(self, mock_soccer):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def _league(league):
+            barrier.wait()
+            return [_make_injury_record(league, "Club", "Out", "Knee", "espn", "soccer")]
+
+        mock_soccer.side_effect = _league
+
+        result = fetch_all_injuries(sports=["soccer"])
+        assert list(result["sources"]) == [
+            "espn_soccer_premier-league", "espn_soccer_la-liga",
+            "espn_soccer_champions-league", "espn_soccer_mls",
+        ]
+        assert all(s["status"] == "ok" for s in result["sources"].values())
+        players = [inj["player"] for inj in result["injuries"]["soccer"]]
+        assert players == ["premier-league", "la-liga", "champions-league", "mls"]
+
     @patch("scripts.injury_sources.parse_espn_injuries", return_value=[])
     @patch("scripts.injury_sources.parse_cbs_injuries", return_value=[])
     @patch("scripts.injury_sources.parse_nba_injury_report", return_value=[])
@@ -522,69 +876,79 @@ class TestFetchAllInjuries:
 class TestDeduplication:
     """Tests for InjuryMonitor._deduplicate_injuries."""
 
-    def _make_monitor(self):
-        with patch.object(ShippClient, "__init__", lambda self, **kw: None):
-            monitor = InjuryMonitor.__new__(InjuryMonitor)
-            monitor.shipp = MagicMock()
-            monitor.state_path = MagicMock()
-            monitor._team_game_map = None
-        return monitor
-
-    def test_keeps_higher_priority_source(self):
-        monitor = self._make_monitor()
+    def test_keeps_higher_priority_source(self, bare_monitor):
         injuries = [
             {"player": "LeBron James", "team": "Lakers", "source": "cbs",
              "status": "out", "updated": "2026-02-18T10:00:00Z"},
             {"player": "LeBron James", "team": "Lakers", "source": "nba_official",
              "status": "questionable", "updated": "2026-02-18T10:00:00Z"},
         ]
-        deduped = monitor._deduplicate_injuries(injuries)
+        deduped = bare_monitor._deduplicate_injuries(injuries)
         assert len(deduped) == 1
         assert deduped[0]["source"] == "nba_official"
 
-    def test_prefers_more_recent_same_priority(self):
-        monitor = self._make_monitor()
+    def test_prefers_more_recent_same_priority(self, bare_monitor):
         injuries = [
             {"player": "LeBron James", "team": "Lakers", "source": "espn",
              "status": "out", "updated": "2026-02-18T08:00:00Z"},
             {"player": "LeBron James", "team": "Lakers", "source": "espn",
              "status": "questionable", "updated": "2026-02-18T12:00:00Z"},
         ]
-        deduped = monitor._deduplicate_injuries(injuries)
+        deduped = bare_monitor._deduplicate_injuries(injuries)
         assert len(deduped) == 1
         assert deduped[0]["status"] == "questionable"  # more recent
 
-    def test_different_players_not_deduped(self):
-        monitor = self._make_monitor()
+    def test_defaulted_update_tie_keeps_last_listed(self, bare_monitor):
+        # One page without dates: both rows default updated to its fetch time
+        fetched_at = "2026-02-18T10:00:00+00:00"
+        injuries = [
+            {"player": "LeBron James", "team": "Lakers", "source": "espn",
+             "status": "out", "updated": fetched_at, "fetched_at": fetched_at},
+            {"player": "LeBron James", "team": "Lakers", "source": "espn",
+             "status": "questionable", "updated": fetched_at, "fetched_at": fetched_at},
+        ]
+        deduped = bare_monitor._deduplicate_injuries(injuries)
+        assert [i["status"] for i in deduped] == ["questionable"]
+
+    def test_explicit_equal_dates_keep_first_listed(self, bare_monitor):
+        fetched_at = "2026-02-18T10:00:00+00:00"
+        injuries = [
+            {"player": "LeBron James", "team": "Lakers", "source": "espn",
+             "status": "out", "updated": "Feb 18", "fetched_at": fetched_at},
+            {"player": "LeBron James", "team": "Lakers", "source": "espn",
+             "status": "questionable", "updated": "Feb 18", "fetched_at": fetched_at},
+        ]
+        deduped = bare_monitor._deduplicate_injuries(injuries)
+        assert [i["status"] for i in deduped] == ["out"]
+
+    def test_different_players_not_deduped(self, bare_monitor):
         injuries = [
             {"player": "LeBron James", "team": "Lakers", "source": "espn",
              "status": "out", "updated": ""},
             {"player": "Anthony Davis", "team": "Lakers", "source": "espn",
              "status": "questionable", "updated": ""},
         ]
-        deduped = monitor._deduplicate_injuries(injuries)
+        deduped = bare_monitor._deduplicate_injuries(injuries)
         assert len(deduped) == 2
 
-    def test_case_insensitive_dedup(self):
-        monitor = self._make_monitor()
+    def test_case_insensitive_dedup(self, bare_monitor):
         injuries = [
             {"player": "LEBRON JAMES", "team": "LAKERS", "source": "espn",
              "status": "out", "updated": "2026-02-18T08:00:00Z"},
             {"player": "lebron james", "team": "lakers", "source": "cbs",
              "status": "questionable", "updated": "2026-02-18T12:00:00Z"},
         ]
-        deduped = monitor._deduplicate_injuries(injuries)
+        deduped = bare_monitor._deduplicate_injuries(injuries)
         assert len(deduped) == 1
 
-    def test_unknown_source_gets_lowest_priority(self):
-        monitor = self._make_monitor()
+    def test_unknown_source_gets_lowest_priority(self, bare_monitor):
         injuries = [
             {"player": "Player A", "team": "Team A", "source": "random_blog",
              "status": "out", "updated": "2026-02-18T10:00:00Z"},
             {"player": "Player A", "team": "Team A", "source": "cbs",
              "status": "questionable", "updated": "2026-02-18T10:00:00Z"},
         ]
-        deduped = monitor._deduplicate_injuries(injuries)
+        deduped = bare_monitor._deduplicate_injuries(injuries)
         assert len(deduped) == 1
         assert deduped[0]["source"] == "cbs"
 
@@ -593,47 +957,39 @@ class TestDeduplication:
 # 10. Change Detection
 # ---------------------------------------------------------------------------
 
+# Read-only previous states; _detect_changes never mutates them.
+_PREV_OUT = types.MappingProxyType({
+    "lebron james|lakers": types.MappingProxyType({"status": "out"}),
+})
+_PREV_QUESTIONABLE = types.MappingProxyType({
+    "lebron james|lakers": types.MappingProxyType({"status": "questionable"}),
+})
+
+
 class TestChangeDetection:
     """Tests for InjuryMonitor._detect_changes."""
 
-    def _make_monitor(self):
-        with patch.object(ShippClient, "__init__", lambda self, **kw: None):
-            monitor = InjuryMonitor.__new__(InjuryMonitor)
-            monitor.shipp = MagicMock()
-            monitor.state_path = MagicMock()
-            monitor._team_game_map = None
-        return monitor
-
-    def test_detects_status_change(self):
-        monitor = self._make_monitor()
+    def test_detects_status_change(self, bare_monitor):
         current = [
             {"player": "LeBron James", "team": "Lakers", "status": "out"},
         ]
-        previous = {
-            "lebron james|lakers": {"status": "questionable"},
-        }
-        result = monitor._detect_changes(current, previous)
+        result = bare_monitor._detect_changes(current, _PREV_QUESTIONABLE)
         assert result[0]["status_changed"] is True
         assert result[0]["previous_status"] == "questionable"
 
-    def test_no_change_when_status_same(self):
-        monitor = self._make_monitor()
+    def test_no_change_when_status_same(self, bare_monitor):
         current = [
             {"player": "LeBron James", "team": "Lakers", "status": "out"},
         ]
-        previous = {
-            "lebron james|lakers": {"status": "out"},
-        }
-        result = monitor._detect_changes(current, previous)
+        result = bare_monitor._detect_changes(current, _PREV_OUT)
         assert result[0]["status_changed"] is False
         assert result[0]["previous_status"] is None
 
-    def test_new_player_no_change(self):
-        monitor = self._make_monitor()
+    def test_new_player_no_change(self, bare_monitor):
         current = [
             {"player": "New Player", "team": "New Team", "status": "out"},
         ]
-        result = monitor._detect_changes(current, {})
+        result = bare_monitor._detect_changes(current, {})
         assert result[0]["status_changed"] is False
         assert result[0]["previous_status"] is None
 
@@ -645,47 +1001,204 @@ class TestChangeDetection:
 class TestAnnotateWithGameContext:
     """Tests for InjuryMonitor._annotate_with_game_context."""
 
-    def _make_monitor(self, team_game_map):
-        with patch.object(ShippClient, "__init__", lambda self, **kw: None):
-            monitor = InjuryMonitor.__new__(InjuryMonitor)
-            monitor.shipp = MagicMock()
-            monitor.state_path = MagicMock()
-            monitor._team_game_map = team_game_map
-        return monitor
-
-    def test_exact_match(self):
-        monitor = self._make_monitor({
+    def test_exact_match(self, bare_monitor):
+        bare_monitor._team_game_map = {
             "los angeles lakers": {
                 "opponent": "Warriors",
                 "time": "19:30",
                 "game_id": "g1",
             }
-        })
+        }
         injuries = [{"player": "LeBron", "team": "Los Angeles Lakers"}]
-        result = monitor._annotate_with_game_context(injuries)
+        result = bare_monitor._annotate_with_game_context(injuries)
         assert result[0]["game_today"] is not None
         assert result[0]["game_today"]["opponent"] == "Warriors"
 
-    def test_partial_match(self):
-        monitor = self._make_monitor({
+    def test_partial_match(self, bare_monitor):
+        bare_monitor._team_game_map = {
             "los angeles lakers": {
                 "opponent": "Warriors",
                 "time": "19:30",
                 "game_id": "g1",
             }
-        })
+        }
         injuries = [{"player": "LeBron", "team": "Lakers"}]
-        result = monitor._annotate_with_game_context(injuries)
+        result = bare_monitor._annotate_with_game_context(injuries)
         # Should match via partial/nickname matching
         assert result[0]["game_today"] is not None
 
-    def test_no_game_today(self):
-        monitor = self._make_monitor({})
+    def test_substring_match_when_nickname_differs(self, bare_monitor):
+        bare_monitor._team_game_map = {
+            "manchester united fc": {
+                "opponent": "Arsenal",
+                "time": "15:00",
+                "game_id": "s1",
+            }
+        }
+        injuries = [{"player": "Player", "team": "Manchester United"}]
+        result = bare_monitor._annotate_with_game_context(injuries)
+        assert result[0]["game_today"]["game_id"] == "s1"
+
+    def test_shared_nickname_falls_back_to_substring(self, bare_monitor):
+        bare_monitor._team_game_map = {
+            "chicago fire": {"opponent": "Crew", "time": "19:30", "game_id": "m1"},
+            "los angeles fc": {"opponent": "Galaxy", "time": "22:30", "game_id": "m2"},
+            "new york city fc": {"opponent": "Union", "time": "19:00", "game_id": "m3"},
+        }
+        injuries = [{"player": "Player", "team": "Chicago Fire FC"}]
+        result = bare_monitor._annotate_with_game_context(injuries)
+        assert result[0]["game_today"]["game_id"] == "m1"
+
+    def test_no_game_today(self, bare_monitor):
+        bare_monitor._team_game_map = {}
         injuries = [{"player": "LeBron", "team": "Lakers"}]
-        result = monitor._annotate_with_game_context(injuries)
+        result = bare_monitor._annotate_with_game_context(injuries)
         assert result[0]["game_today"] is None
 
 
+class TestScheduleCaching:
+    """Tests for the per-day schedule caches on InjuryMonitor."""
+
+    def test_todays_games_fetched_once(self, bare_monitor):
+        bare_monitor.shipp = MagicMock()
+        bare_monitor.shipp.get_todays_games.return_value = [{"game_id": "g1"}]
+        assert len(bare_monitor._todays_games("nba")) == 1
+        assert len(bare_monitor._todays_games("nba")) == 1
+        bare_monitor.shipp.get_todays_games.assert_called_once_with("nba")
+
+    def test_caches_expire_when_date_changes(self, bare_monitor):
+        bare_monitor.shipp = MagicMock()
+        bare_monitor.shipp.get_todays_games.return_value = [{"game_id": "g1"}]
+        bare_monitor.shipp.build_team_game_map.return_value = {}
+        bare_monitor._todays_games("nba")
+        bare_monitor._get_team_game_map()
+
+        bare_monitor._cache_date = "2000-01-01"
+        bare_monitor._todays_games("nba")
+        bare_monitor._get_team_game_map()
+        assert bare_monitor.shipp.get_todays_games.call_count == 2
+        assert bare_monitor.shipp.build_team_game_map.call_count == 2
+
+    def test_cache_date_follows_utc_day(self, bare_monitor):
+        with patch("scripts.injury_monitor.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime(2026, 10, 14, 23, 30, tzinfo=timezone.utc)
+            bare_monitor._expire_daily_caches()
+        mock_dt.now.assert_called_once_with(timezone.utc)
+        assert bare_monitor._cache_date == "2026-10-14"
+
+    def test_invalidate_rebuilds_schedule_lookups(self, bare_monitor):
+        bare_monitor.shipp = MagicMock()
+        bare_monitor.shipp.get_todays_games.return_value = [{"game_id": "g1"}]
+        bare_monitor.shipp.build_team_game_map.return_value = {}
+        bare_monitor._todays_games("nba")
+        bare_monitor._get_team_game_map()
+
+        bare_monitor.invalidate()
+        bare_monitor._todays_games("nba")
+        bare_monitor._get_team_game_map()
+        assert bare_monitor.shipp.get_todays_games.call_count == 2
+        assert bare_monitor.shipp.build_team_game_map.call_count == 2
+
+
+class TestReportCache:
+    """Tests for report caching in InjuryMonitor.get_full_report."""
+
+    @pytest.fixture
+    def monitor(self, bare_monitor, tmp_path):
+        bare_monitor.shipp = MagicMock()
+        bare_monitor.shipp.get_todays_games.return_value = []
+        bare_monitor.shipp.build_team_game_map.return_value = {}
+        bare_monitor.state_path = tmp_path / "state.json"
+        return bare_monitor
+
+    @patch("scripts.injury_monitor.fetch_all_injuries")
+    def test_accessors_share_one_fetch(self, mock_fetch, monitor):
+        mock_fetch.return_value = {"injuries": {"nba": []}, "sources": {}}
+        report = monitor.get_full_report(sports=["nba"])
+        monitor.get_status_changes(sports=["nba"])
+        monitor.get_today_impact(sports=["nba"])
+        assert monitor.get_report("nba") is report
+        assert mock_fetch.call_count == 1
+
+    @patch("scripts.injury_monitor.fetch_all_injuries")
+    def test_invalidate_forces_refetch(self, mock_fetch, monitor):
+        mock_fetch.return_value = {"injuries": {"nba": []}, "sources": {}}
+        monitor.get_full_report(sports=["nba"])
+        monitor.invalidate()
+        monitor.get_full_report(sports=["nba"])
+        assert mock_fetch.call_count == 2
+
+    @patch("scripts.injury_monitor.fetch_all_injuries")
+    def test_daily_caches_expire_only_on_calling_thread(self, mock_fetch, monitor):
+        mock_fetch.return_value = {"injuries": {"nba": [], "mlb": []}, "sources": {}}
+        threads = []
+        expire = monitor._expire_daily_caches
+        monitor._expire_daily_caches = lambda: (threads.append(threading.get_ident()), expire())
+        monitor.get_full_report(sports=["nba", "mlb"])
+        assert threads and set(threads) == {threading.get_ident()}
+
+    @patch("scripts.injury_monitor.fetch_all_injuries")
+    def test_report_records_omit_working_fields(self, mock_fetch, monitor):
+        mock_fetch.return_value = {
+            "injuries": {"nba": [
+                _make_injury_record("LeBron James", "Lakers", "Out", "Ankle", "espn", "nba"),
+            ]},
+            "sources": {},
+        }
+        report = monitor.get_full_report(sports=["nba"])
+        inj = report.data["sports"]["nba"]["injuries"][0]
+        assert not any(k.startswith("_") for k in inj)
+        assert "lebron james|lakers" in monitor._load_state()
+
+    @patch("scripts.injury_monitor.fetch_all_injuries")
+    def test_affected_games_counts_distinct_games(self, mock_fetch, monitor):
+        mock_fetch.return_value = {
+            "injuries": {"nba": [
+                _make_injury_record("LeBron James", "Los Angeles Lakers", "Out", "Ankle", "espn", "nba"),
+                _make_injury_record("Jayson Tatum", "Boston Celtics", "Out", "Wrist", "espn", "nba"),
+            ]},
+            "sources": {},
+        }
+        monitor.shipp.build_team_game_map.return_value = {
+            "los angeles lakers": {"opponent": "Golden State Warriors", "time": "19:30", "game_id": "g1"},
+            "golden state warriors": {"opponent": "Los Angeles Lakers", "time": "19:30", "game_id": "g1"},
+            "boston celtics": {"opponent": "Miami Heat", "time": "19:00", "game_id": "g2"},
+        }
+        report = monitor.get_full_report(sports=["nba"])
+        assert report.data["sports"]["nba"]["affected_games"] == 2
+
+    @patch("scripts.injury_monitor.fetch_all_injuries")
+    def test_stale_state_entries_are_evicted(self, mock_fetch, monitor):
+        mock_fetch.return_value = {"injuries": {"nba": []}, "sources": {}}
+        recent = datetime.now(timezone.utc).isoformat()
+        monitor._save_state({
+            "old|team": {"status": "out", "last_seen": "2020-01-01T00:00:00+00:00"},
+            "recent|team": {"status": "out", "last_seen": recent},
+        })
+        monitor.get_full_report(sports=["nba"])
+        assert set(monitor._load_state()) == {"recent|team"}
+
+    @patch("scripts.injury_monitor.fetch_all_injuries")
+    def test_persist_false_skips_state_write(self, mock_fetch, monitor):
+        mock_fetch.return_value = {"injuries": {"nba": []}, "sources": {}}
+        monitor.get_full_report(sports=["nba"], persist=False)
+        assert not monitor.state_path.exists()
+
+    @patch("scripts.injury_monitor.fetch_all_injuries")
+    def test_cached_unpersisted_report_saves_when_persist_requested(self, mock_fetch, monitor):
+        mock_fetch.return_value = {
+            "injuries": {"nba": [
+                _make_injury_record("LeBron James", "Lakers", "Out", "Ankle", "espn", "nba"),
+            ]},
+            "sources": {},
+        }
+        report = monitor.get_full_report(sports=["nba"], persist=False)
+        assert not monitor.state_path.exists()
+        assert monitor.get_full_report(sports=["nba"]) is report
+        assert mock_fetch.call_count == 1
+        assert set(monitor._load_state()) == {"lebron james|lakers"}
+
+
 # ---------------------------------------------------------------------------
 # 12. InjuryReport Formatting
 # ---------------------------------------------------------------------------
@@ -752,22 +1265,12 @@ class TestInjuryReport:
         assert "1 succeeded, 1 failed" in summary
         assert "cbs_nba" in summary
 
-    def test_summary_caps_other_injuries_at_20(self):
+    def test_summary_caps_other_injuries_at_20(self, bulk_injury_list):
         """If there are more than 20 non-game-day, non-changed injuries, cap display."""
-        injuries = []
-        for i in range(25):
-            injuries.append({
-                "player": f"Player {i}",
-                "team": f"Team {i}",
-                "status": "out",
-                "status_changed": False,
-                "game_today": None,
-                "injury": "Knee",
-            })
         data = {
             "sports": {
                 "nba": {
-                    "injuries": injuries,
+                    "injuries": bulk_injury_list,
                     "games_today": 0,
                     "affected_games": 0,
                 }
@@ -783,101 +1286,259 @@ class TestInjuryReport:
 # 13. State Persistence
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def state_dir(tmp_path_factory):
+    """One directory per test class; each test uses its own file in it."""
+    return tmp_path_factory.mktemp("state")
+
+
 class TestStatePersistence:
     """Tests for _load_state and _save_state."""
 
-    def test_load_state_returns_empty_when_no_file(self):
-        with patch.object(ShippClient, "__init__", lambda self, **kw: None):
-            monitor = InjuryMonitor.__new__(InjuryMonitor)
-            monitor.shipp = MagicMock()
-            monitor._team_game_map = None
-            with tempfile.NamedTemporaryFile(suffix=".json", delete=True) as f:
-                # File is deleted on close, so path won't exist
-                from pathlib import Path
-                monitor.state_path = Path(f.name + "_nonexistent")
-            assert monitor._load_state() == {}
-
-    def test_save_and_load_state_roundtrip(self):
-        with patch.object(ShippClient, "__init__", lambda self, **kw: None):
-            monitor = InjuryMonitor.__new__(InjuryMonitor)
-            monitor.shipp = MagicMock()
-            monitor._team_game_map = None
-            with tempfile.TemporaryDirectory() as tmpdir:
-                from pathlib import Path
-                monitor.state_path = Path(tmpdir) / "state.json"
-                state = {"player|team": {"status": "out", "injury": "Knee"}}
-                monitor._save_state(state)
-                loaded = monitor._load_state()
-                assert loaded == state
-
-    def test_load_state_handles_corrupt_json(self):
-        with patch.object(ShippClient, "__init__", lambda self, **kw: None):
-            monitor = InjuryMonitor.__new__(InjuryMonitor)
-            monitor.shipp = MagicMock()
-            monitor._team_game_map = None
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as f:
-                f.write("NOT VALID JSON {{{")
-                f.flush()
-                from pathlib import Path
-                monitor.state_path = Path(f.name)
-            try:
-                result = monitor._load_state()
-                assert result == {}
-            finally:
-                os.unlink(f.name)
+    @pytest.fixture
+    def state_path(self, state_dir, request):
+        return state_dir / f"{request.node.name}.json"
+
+    @pytest.mark.parametrize("payload,expected", [
+        (None, {}),
+        ({"player|team": {"status": "out", "injury": "Knee"}},
+         {"player|team": {"status": "out", "injury": "Knee"}}),
+        ({"josé weiß|fc köln": {"status": "out"}},
+         {"josé weiss|fc köln": {"status": "out"}}),
+        (b"NOT VALID JSON {{{", {}),
+        (b'{"a|b": "\xff\xfe"}', {}),
+    ], ids=["no_file", "roundtrip", "lowercased_key", "corrupt_json", "non_utf8"])
+    def test_load_state(self, bare_monitor, state_path, payload, expected):
+        """A dict payload is saved first, bytes are written raw, None writes nothing."""
+        bare_monitor.state_path = state_path
+        if isinstance(payload, dict):
+            bare_monitor._save_state(payload)
+        elif payload is not None:
+            state_path.write_bytes(payload)
+        assert bare_monitor._load_state() == expected
+
+    def test_save_state_is_compact_and_leaves_no_temp_file(self, bare_monitor, state_path):
+        bare_monitor.state_path = state_path
+        bare_monitor._save_state({"player|team": {"status": "out"}})
+        assert "\n" not in state_path.read_text()
+        assert not state_path.with_name(state_path.name + ".tmp").exists()
 
 
 # ---------------------------------------------------------------------------
 # 14. Build Current State
 # ---------------------------------------------------------------------------
 
+# One run's injuries, shared by the state-building tests
+_LAKERS_INJURIES_BY_SPORT = {
+    "nba": [
+        {"player": "LeBron James", "team": "Lakers", "status": "out", "injury": "Ankle"},
+        {"player": "Anthony Davis", "team": "Lakers", "status": "questionable", "injury": "Knee"},
+    ]
+}
+
+
 class TestBuildCurrentState:
     """Tests for InjuryMonitor._build_current_state."""
 
-    def test_builds_state_from_injuries(self):
-        with patch.object(ShippClient, "__init__", lambda self, **kw: None):
-            monitor = InjuryMonitor.__new__(InjuryMonitor)
-            monitor.shipp = MagicMock()
-            monitor.state_path = MagicMock()
-            monitor._team_game_map = None
-
-        injuries_by_sport = {
-            "nba": [
-                {"player": "LeBron James", "team": "Lakers", "status": "out", "injury": "Ankle"},
-                {"player": "Anthony Davis", "team": "Lakers", "status": "questionable", "injury": "Knee"},
-            ]
-        }
-        state = monitor._build_current_state(injuries_by_sport)
+    def test_builds_state_from_injuries(self, bare_monitor):
+        state = bare_monitor._build_current_state(_LAKERS_INJURIES_BY_SPORT)
         assert "lebron james|lakers" in state
         assert state["lebron james|lakers"]["status"] == "out"
         assert "anthony davis|lakers" in state
         assert state["anthony davis|lakers"]["status"] == "questionable"
 
 
+class TestStateDelta:
+    """Tests for InjuryMonitor._state_delta."""
+
+    def _entry(self, status="out", last_seen="2026-02-18T10:00:00+00:00"):
+        return {"status": status, "injury": "Knee", "sport": "nba", "last_seen": last_seen}
+
+    def test_same_day_resighting_is_not_a_change(self, bare_monitor):
+        previous = {"a|b": self._entry()}
+        current = {"a|b": self._entry(last_seen="2026-02-18T22:00:00+00:00")}
+        assert bare_monitor._state_delta(previous, current) == {}
+
+    def test_status_change_and_new_key_included(self, bare_monitor):
+        previous = {"a|b": self._entry()}
+        current = {"a|b": self._entry(status="questionable"), "c|d": self._entry()}
+        assert set(bare_monitor._state_delta(previous, current)) == {"a|b", "c|d"}
+
+    def test_new_day_refreshes_last_seen(self, bare_monitor):
+        previous = {"a|b": self._entry()}
+        current = {"a|b": self._entry(last_seen="2026-02-19T01:00:00+00:00")}
+        assert "a|b" in bare_monitor._state_delta(previous, current)
+
+
 # ---------------------------------------------------------------------------
 # 15. ShippClient
 # ---------------------------------------------------------------------------
 
+# Read-only schedule payload; build_team_game_map never mutates its input
+_NBA_GAMES_PAYLOAD = {
+    "nba": [
+        {
+            "game_id": "g1",
+            "home_team": "Los Angeles Lakers",
+            "away_team": "Golden State Warriors",
+            "start_time": "19:30",
+            "status": "scheduled",
+        }
+    ]
+}
+
+
 class TestShippClient:
     """Tests for the ShippClient wrapper."""
 
-    def test_raises_without_api_key(self):
-        # Temporarily remove the env var
-        with patch.dict(os.environ, {}, clear=True):
-            # Also explicitly remove SHIPP_API_KEY if present
-            env_copy = os.environ.copy()
-            for k in list(env_copy.keys()):
-                if k == "SHIPP_API_KEY":
-                    del os.environ[k]
-            with pytest.raises(ValueError, match="SHIPP_API_KEY is required"):
-                ShippClient()
+    def test_raises_without_api_key(self, monkeypatch):
+        monkeypatch.delenv("SHIPP_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="SHIPP_API_KEY is required"):
+            ShippClient()
 
     def test_accepts_explicit_api_key(self):
         client = ShippClient(api_key="my-test-key")
         assert client.api_key == "my-test-key"
 
+    def test_session_pool_sized_for_fan_out(self):
+        client = ShippClient(api_key="test-key")
+        adapter = client.session.get_adapter("https://api.shipp.ai/api/v1")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 0
+
+    def test_all_todays_games_fetched_concurrently(self):
+        client = ShippClient(api_key="test-key")
+        barrier = threading.Barrier(3, timeout=5)
+        dates = set()
+
+        def _games(sport, date=None):
+            dates.add(date)
+            barrier.wait()
+            return [] if sport == "mlb" else [{"game_id": f"{sport}-1"}]
+
+        with patch.object(client, "get_todays_games", side_effect=_games):
+            all_games = client.get_all_todays_games()
+        assert len(dates) == 1 and None not in dates
+        assert list(all_games) == ["nba", "soccer"]
+        assert all_games["soccer"] == [{"game_id": "soccer-1"}]
+
+    def test_all_live_scores_gathered_across_sports(self):
+        client = ShippClient(api_key="test-key")
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _scores(sport):
+            barrier.wait()
+            return [{"sport": sport}]
+
+        with patch.object(client, "get_live_scores", side_effect=_scores):
+            scores = client.get_all_live_scores(["nba", "mlb"])
+        assert scores == {"nba": [{"sport": "nba"}], "mlb": [{"sport": "mlb"}]}
+
+    def test_build_team_game_map_casefolds_names(self):
+        client = ShippClient(api_key="test-key")
+        with patch.object(client, "get_all_todays_games") as mock_games:
+            mock_games.return_value = {"soccer": [{
+                "game_id": "g9",
+                "home_team": "FC Straßburg",
+                "away_team": "Olympique Lyonnais",
+                "start_time": "20:00",
+            }]}
+            team_map = client.build_team_game_map()
+        assert team_map["fc strassburg"]["opponent"] == "Olympique Lyonnais"
+
+    def test_build_team_game_map_reused_when_schedule_unchanged(self):
+        client = ShippClient(api_key="test-key")
+        game = {"game_id": "g1", "home_team": "Lakers", "away_team": "Warriors",
+                "start_time": "19:30"}
+        with patch.object(client, "get_all_todays_games") as mock_games:
+            mock_games.return_value = {"nba": [dict(game)]}
+            first = client.build_team_game_map()
+            mock_games.return_value = {"nba": [dict(game)]}
+            assert client.build_team_game_map() is first
+
+            mock_games.return_value = {"nba": [dict(game, start_time="20:00")]}
+            moved = client.build_team_game_map()
+        assert moved is not first
+        assert moved["lakers"]["time"] == "20:00"
+
+    def test_schedule_cached_per_sport_and_date(self):
+        client = ShippClient(api_key="test-key")
+        with patch.object(client, "_request", return_value={"games": []}) as mock_req:
+            client.get_schedule("nba", date="2026-10-14")
+            client.get_schedule("nba", date="2026-10-14")
+            client.get_schedule("mlb", date="2026-10-14")
+            client.get_schedule("nba", date="2026-10-15")
+        assert mock_req.call_count == 3
+
+    def test_schedule_refetched_after_ttl(self):
+        client = ShippClient(api_key="test-key")
+        client.schedule_ttl = 0
+        with patch.object(client, "_request", return_value={"games": []}) as mock_req:
+            client.get_schedule("nba", date="2026-10-14")
+            client.get_schedule("nba", date="2026-10-14")
+        assert mock_req.call_count == 2
+
+    def test_failed_live_scores_not_cached(self):
+        client = ShippClient(api_key="test-key")
+        with patch.object(client, "_request") as mock_req:
+            mock_req.side_effect = RuntimeError("down")
+            assert client.get_live_scores("nba") == []
+            mock_req.side_effect = [{"connection_id": "c1"}, {"data": [{"game_id": "g1"}]}]
+            assert client.get_live_scores("nba") == [{"game_id": "g1"}]
+            # Served from the short-lived cache
+            assert client.get_live_scores("nba") == [{"game_id": "g1"}]
+        assert mock_req.call_count == 3
+
+    def test_api_key_sent_as_session_param(self):
+        client = ShippClient(api_key="test-key")
+        url = client._base + "/sports/nba/schedule"
+        assert url == "https://api.shipp.ai/api/v1/sports/nba/schedule"
+        prepared = client.session.prepare_request(requests.Request(
+            "GET", url, params={"date": "2026-10-14"}
+        ))
+        assert "api_key=test-key" in prepared.url
+        assert "date=2026-10-14" in prepared.url
+
+    def test_request_releases_connection(self):
+        client = ShippClient(api_key="test-key")
+        resp = _FakeResponse(json_data={"games": []})
+        with patch.object(client.session, "request", return_value=resp):
+            assert client._request("GET", "/sports/nba/schedule") == {"games": []}
+        assert resp.closed
+
+    @patch("scripts.shipp_wrapper.time.sleep")
+    def test_request_retries_5xx_with_jittered_backoff(self, mock_sleep):
+        client = ShippClient(api_key="test-key")
+        responses = [_FakeResponse(status_code=503), _FakeResponse(json_data={"ok": 1})]
+        with patch.object(client.session, "request", side_effect=responses), \
+             patch("scripts.shipp_wrapper.random.uniform", return_value=0.25) as mock_jitter:
+            assert client._request("GET", "/sports/nba/schedule") == {"ok": 1}
+        mock_jitter.assert_called_once_with(0, 0.5)
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_request_does_not_retry_4xx(self):
+        client = ShippClient(api_key="test-key")
+        resp = _FakeResponse(status_code=404)
+        with patch.object(client.session, "request", return_value=resp) as mock_req:
+            with pytest.raises(RuntimeError, match="client error 404"):
+                client._request("GET", "/sports/nba/schedule")
+        assert mock_req.call_count == 1
+
+    @patch("scripts.shipp_wrapper.random.uniform", return_value=0.5)
+    @patch("scripts.shipp_wrapper.time.sleep")
+    @patch("scripts.shipp_wrapper.time.monotonic")
+    def test_request_gives_up_at_deadline(self, mock_clock, mock_sleep, mock_jitter):
+        client = ShippClient(api_key="test-key")
+        ticks = iter([0.0, 10.0, 29.9])
+        mock_clock.side_effect = lambda: next(ticks)
+        with patch.object(
+            client.session, "request",
+            side_effect=requests.exceptions.ConnectionError("refused"),
+        ) as mock_req:
+            with pytest.raises(RuntimeError, match="after 2 attempts: Connection error: refused"):
+                client._request("GET", "/sports/nba/schedule")
+        assert mock_req.call_count == 2
+
     @patch("scripts.shipp_wrapper.requests.Session")
     def test_build_team_game_map(self, mock_session_cls):
         mock_session = MagicMock()
@@ -888,17 +1549,7 @@ class TestShippClient:
 
         # Mock get_all_todays_games
         with patch.object(client, "get_all_todays_games") as mock_games:
-            mock_games.return_value = {
-                "nba": [
-                    {
-                        "game_id": "g1",
-                        "home_team": "Los Angeles Lakers",
-                        "away_team": "Golden State Warriors",
-                        "start_time": "19:30",
-                        "status": "scheduled",
-                    }
-                ]
-            }
+            mock_games.return_value = _NBA_GAMES_PAYLOAD
             team_map = client.build_team_game_map()
             assert "los angeles lakers" in team_map
             assert "golden state warriors" in team_map
@@ -912,6 +1563,25 @@ class TestShippClient:
 # 16. Edge Cases
 # ---------------------------------------------------------------------------
 
+# Parsed once at import (lxml when installed); the parsers only read them
+_EMPTY_SOUP = BeautifulSoup("<html><body></body></html>", HTML_PARSER)
+_MALFORMED_SOUP = BeautifulSoup("<div><table><tr><td>unclosed", HTML_PARSER)
+
+# Canned MLB replies; parse_mlb_transactions decodes its own copy each call
+_EMPTY_TX = _FakeResponse(json_data={"transactions": []})
+_IL60_TX = _FakeResponse(json_data={
+    "transactions": [
+        {
+            "description": "Transferred to 60-Day IL due to torn UCL",
+            "typeDesc": "Transferred to 60-Day IL",
+            "player": {"fullName": "Player Z"},
+            "team": {"name": "Team Z"},
+            "effectiveDate": "2026-02-18",
+        }
+    ]
+})
+
+
 class TestEdgeCases:
     """Edge-case and boundary tests."""
 
@@ -921,23 +1591,21 @@ class TestEdgeCases:
 
     def test_empty_transactions_list(self):
         """MLb parser handles empty transactions array."""
-        with patch("scripts.injury_sources.requests.get") as mock_get, \
-             patch("scripts.injury_sources.time.sleep"):
-            mock_get.return_value = _mock_response(json_data={"transactions": []})
+        with patch("scripts.injury_sources._SESSION.get") as mock_get:
+            mock_get.return_value = _EMPTY_TX
             injuries = parse_mlb_transactions()
             assert injuries == []
 
-    def test_mlb_60_day_il(self):
-        """60-Day IL placement should be detected correctly."""
-        with patch("scripts.injury_sources.requests.get") as mock_get, \
-             patch("scripts.injury_sources.time.sleep"):
-            mock_get.return_value = _mock_response(json_data={
+    def test_mlb_status_prefers_60_day_over_earlier_15_day(self):
+        """Rule precedence, not position, decides the IL bucket."""
+        with patch("scripts.injury_sources._SESSION.get") as mock_get:
+            mock_get.return_value = _FakeResponse(json_data={
                 "transactions": [
                     {
-                        "description": "Transferred to 60-Day IL due to torn UCL",
-                        "typeDesc": "Transferred to 60-Day IL",
-                        "player": {"fullName": "Player Z"},
-                        "team": {"name": "Team Z"},
+                        "description": "Player W transferred from the 15-day injured list to the 60-day injured list.",
+                        "typeDesc": "Status Change",
+                        "player": {"fullName": "Player W"},
+                        "team": {"name": "Team W"},
                         "effectiveDate": "2026-02-18",
                     }
                 ]
@@ -946,22 +1614,26 @@ class TestEdgeCases:
             assert len(injuries) == 1
             assert injuries[0]["status"] == "il-60"
 
+    def test_mlb_60_day_il(self):
+        """60-Day IL placement should be detected correctly."""
+        with patch("scripts.injury_sources._SESSION.get") as mock_get:
+            mock_get.return_value = _IL60_TX
+            injuries = parse_mlb_transactions()
+            assert len(injuries) == 1
+            assert injuries[0]["status"] == "il-60"
+
     @patch("scripts.injury_sources._fetch_html")
     def test_espn_empty_page(self, mock_fetch):
         """An empty page (no tables) should return empty list without error."""
-        from bs4 import BeautifulSoup
-        mock_fetch.return_value = BeautifulSoup("<html><body></body></html>", "html.parser")
+        mock_fetch.return_value = _EMPTY_SOUP
         injuries = parse_espn_injuries("nba")
         assert injuries == []
 
     @patch("scripts.injury_sources._fetch_html")
     def test_malformed_html_does_not_crash(self, mock_fetch):
         """Badly formed HTML should still be handled without crashing."""
-        from bs4 import BeautifulSoup
         # BeautifulSoup is quite forgiving; verify we don't crash
-        mock_fetch.return_value = BeautifulSoup(
-            "<div><table><tr><td>unclosed", "html.parser"
-        )
+        mock_fetch.return_value = _MALFORMED_SOUP
         injuries = parse_espn_injuries("nba")
         # Might or might not parse anything, but should not raise
         assert isinstance(injuries, list)